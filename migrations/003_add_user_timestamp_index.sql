@@ -0,0 +1,9 @@
+-- Migration ID: 003
+-- Description: Back per-user history queries with a (user_id, timestamp) index
+-- Created: 2026-10-15
+
+CREATE INDEX IF NOT EXISTS idx_messages_user_timestamp
+ON chat_messages (user_id, timestamp);
+
+-- Covered by the leading column of idx_messages_user_timestamp.
+DROP INDEX IF EXISTS idx_messages_user_id;
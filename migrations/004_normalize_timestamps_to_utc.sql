@@ -0,0 +1,47 @@
+-- Migration ID: 004
+-- Description: Store every timestamp as naive UTC text ("YYYY-MM-DD HH:MM:SS.ffffff")
+-- Created: 2026-10-15
+
+-- Rows without a UTC offset were written with datetime.now(), i.e. in the
+-- server's local time; the 'utc' modifier converts them using that same zone.
+UPDATE chat_messages
+SET timestamp = strftime('%Y-%m-%d %H:%M:%S', timestamp, 'utc')
+    || '.' || CASE WHEN substr(timestamp, 20, 1) = '.' THEN substr(timestamp, 21, 6) ELSE '000000' END
+WHERE timestamp IS NOT NULL
+  AND instr(substr(timestamp, 20), '+') = 0
+  AND instr(substr(timestamp, 20), '-') = 0;
+
+-- Each users column is checked on its own: a row may hold a local-time
+-- created_at next to an offset updated_at, or the other way round.
+UPDATE users
+SET created_at = strftime('%Y-%m-%d %H:%M:%S', created_at, 'utc')
+    || '.' || CASE WHEN substr(created_at, 20, 1) = '.' THEN substr(created_at, 21, 6) ELSE '000000' END
+WHERE created_at IS NOT NULL
+  AND instr(substr(created_at, 20), '+') = 0
+  AND instr(substr(created_at, 20), '-') = 0;
+
+UPDATE users
+SET updated_at = strftime('%Y-%m-%d %H:%M:%S', updated_at, 'utc')
+    || '.' || CASE WHEN substr(updated_at, 20, 1) = '.' THEN substr(updated_at, 21, 6) ELSE '000000' END
+WHERE updated_at IS NOT NULL
+  AND instr(substr(updated_at, 20), '+') = 0
+  AND instr(substr(updated_at, 20), '-') = 0;
+
+-- Rows with an offset (e.g. "+00:00") are shifted to UTC by SQLite itself.
+UPDATE chat_messages
+SET timestamp = strftime('%Y-%m-%d %H:%M:%S', timestamp)
+    || '.' || CASE WHEN substr(timestamp, 20, 1) = '.' THEN substr(timestamp, 21, 6) ELSE '000000' END
+WHERE instr(substr(timestamp, 20), '+') > 0
+   OR instr(substr(timestamp, 20), '-') > 0;
+
+UPDATE users
+SET created_at = strftime('%Y-%m-%d %H:%M:%S', created_at)
+    || '.' || CASE WHEN substr(created_at, 20, 1) = '.' THEN substr(created_at, 21, 6) ELSE '000000' END
+WHERE instr(substr(created_at, 20), '+') > 0
+   OR instr(substr(created_at, 20), '-') > 0;
+
+UPDATE users
+SET updated_at = strftime('%Y-%m-%d %H:%M:%S', updated_at)
+    || '.' || CASE WHEN substr(updated_at, 20, 1) = '.' THEN substr(updated_at, 21, 6) ELSE '000000' END
+WHERE instr(substr(updated_at, 20), '+') > 0
+   OR instr(substr(updated_at, 20), '-') > 0;
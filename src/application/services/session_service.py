@@ -1,27 +1,44 @@
 """Session services for user initialization."""
 
+from collections.abc import Awaitable
+from typing import Protocol
+
 from src.domain.models.user import User
 from src.domain.repositories.user_repository import IUserRepository
 
 
-class SessionService:
-    """Service for session-level user operations."""
+class GetOrCreateUser(Protocol):  # pylint: disable=too-few-public-methods
+    """Callable that returns the user for a username, creating it if needed."""
 
-    def __init__(self, *, user_repository: IUserRepository) -> None:
-        """Initialize the session service.
+    def __call__(self, username: str) -> Awaitable[User]:
+        """Get or create the user.
 
         Args:
-            user_repository: Repository for user persistence.
+            username: Name of the user.
+
+        Returns:
+            Awaitable resolving to the existing or newly created user.
         """
-        self._user_repository = user_repository
+        ...  # pylint: disable=unnecessary-ellipsis
 
-    async def get_or_create_user(self, *, username: str) -> User:
-        """Get or create a user for the provided username.
 
-        Args:
-            username: Username to resolve.
+class SessionService:  # pylint: disable=too-few-public-methods
+    """Service for session-level user operations.
 
-        Returns:
-            The existing or newly created user.
+    Attributes:
+        get_or_create_user: Get or create a user for the provided username.
+            Bound directly to the repository's ``get_or_create`` so calls
+            do not go through an extra coroutine frame.
+    """
+
+    __slots__ = ("get_or_create_user",)
+
+    get_or_create_user: GetOrCreateUser
+
+    def __init__(self, *, user_repository: IUserRepository) -> None:
+        """Initialize the session service.
+
+        Args:
+            user_repository: Repository for user persistence.
         """
-        return await self._user_repository.get_or_create(username)
+        self.get_or_create_user = user_repository.get_or_create
@@ -1,6 +1,7 @@
 """Use case for resolving system prompts."""
 
 from src.config.prompts import PromptConfig
+from src.domain.models.provider_message import ProviderMessage
 
 
 class GetSystemPromptUseCase:
@@ -28,3 +29,14 @@ class GetSystemPromptUseCase:
             Resolved system prompt string.
         """
         return self._prompt_config.resolve_system_prompt(variant)
+
+    async def execute_message(self, *, variant: str | None = None) -> ProviderMessage:
+        """Resolve the system prompt as a provider message.
+
+        Args:
+            variant: Optional prompt variant key.
+
+        Returns:
+            Shared system ProviderMessage for the resolved prompt.
+        """
+        return self._prompt_config.resolve_system_provider_message(variant)
@@ -37,8 +37,4 @@ class LoadHistoryUseCase:
             offset=0,
         )
 
-        provider_messages = []
-        for message in reversed(history):
-            provider_messages.append(ProviderMessage(role=message.role, content=message.content))
-
-        return provider_messages
+        return [ProviderMessage(role=message.role, content=message.content) for message in history]
@@ -1,6 +1,9 @@
 """Use case for sending a message through a provider."""
 
+import asyncio
+import io
 from collections.abc import AsyncIterator
+from logging import getLogger
 
 from src.domain.errors.exceptions import ProviderError
 from src.domain.interfaces.provider import Provider
@@ -12,6 +15,8 @@ from src.domain.repositories.message_repository import IMessageRepository
 from .get_system_prompt import GetSystemPromptUseCase
 from .load_history import LoadHistoryUseCase
 
+logger = getLogger(__name__)
+
 
 class SendMessageUseCase:  # pylint: disable=too-few-public-methods
     """Orchestrate message sending with provider response streaming.
@@ -72,34 +77,61 @@ class SendMessageUseCase:  # pylint: disable=too-few-public-methods
             role=MessageRole.USER,
             content=user_input,
         )
-        await self._message_repository.save(user_message)
-
-        history = await self._load_history_use_case.execute(
-            user_id=user_id,
-            limit=history_limit,
-        )
 
-        system_prompt = await self._get_system_prompt_use_case.execute(
-            variant=prompt_variant,
+        # The user message is persisted together with the reply, so history
+        # never contains the current input; it is appended explicitly and
+        # one history slot is reserved for it.
+        history_task = asyncio.create_task(
+            self._load_history_use_case.execute(
+                user_id=user_id,
+                limit=max(history_limit - 1, 0),
+            )
         )
 
-        provider_messages: list[ProviderMessage] = [
-            ProviderMessage(role=MessageRole.SYSTEM, content=system_prompt),
-        ]
-        provider_messages.extend(history)
-
-        response_chunks: list[str] = []
+        response_buffer = io.StringIO()
+        streamed = False
 
         try:
-            async for token in self._provider.stream_response(provider_messages):
-                response_chunks.append(token)
+            # The prompt lookup normally finishes without suspending, so it is
+            # awaited inline rather than wrapped in a task of its own.
+            try:
+                system_message = await self._get_system_prompt_use_case.execute_message(
+                    variant=prompt_variant,
+                )
+            except BaseException:
+                history_task.cancel()
+                raise
+
+            # The context list is passed without keeping a local reference, so
+            # it is not pinned by this frame for the whole generation.
+            stream = self._provider.stream_response(
+                [
+                    system_message,
+                    *await history_task,
+                    ProviderMessage(role=MessageRole.USER, content=user_input),
+                ]
+            )
+
+            async for token in stream:
+                response_buffer.write(token)
                 yield token
-        except ProviderError:
-            raise
-        except Exception as exc:
+            streamed = True
+        except OSError as exc:
+            # Providers raise ProviderError themselves; only transport errors
+            # (ConnectionError, TimeoutError, ...) that escape them are wrapped.
             raise ProviderError(f"Provider stream failed: {exc}") from exc
-
-        response_text = "".join(response_chunks)
+        finally:
+            if not streamed:
+                # Keep the user input even when no reply is produced, whether
+                # history, prompt, provider setup or the stream itself failed.
+                # An error is already propagating here, so a failed save is
+                # logged rather than allowed to replace it.
+                try:
+                    await self._message_repository.save(user_message)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("Failed to save user message after an interrupted response")
+
+        response_text = response_buffer.getvalue()
 
         assistant_message = ChatMessage.create(
             user_id=user_id,
@@ -107,4 +139,4 @@ class SendMessageUseCase:  # pylint: disable=too-few-public-methods
             role=MessageRole.ASSISTANT,
             content=response_text,
         )
-        await self._message_repository.save(assistant_message)
+        await self._message_repository.save_many([user_message, assistant_message])
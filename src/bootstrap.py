@@ -1,37 +1,89 @@
 """Application bootstrap utilities."""
 
 import asyncio
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future
 from logging import getLogger
-
-import aiosqlite
+from typing import Any
 
 from src.config.app import AppConfig, get_config
 from src.infrastructure.container import Container
 from src.infrastructure.database.migrator import AsyncDatabaseMigrator
+from src.infrastructure.database.pool import SQLiteConnectionPool
 from src.infrastructure.logging import configure_logging
 
 logger = getLogger(__name__)
 
 _container: Container | None = None  # pylint: disable=invalid-name
+# A build in progress, shared by callers on any event loop; an asyncio.Lock
+# would be bound to the first loop that contends on it.
+_container_build: Future[Container] | None = None  # pylint: disable=invalid-name
+_container_build_lock = threading.Lock()
+
+_background_loop: asyncio.AbstractEventLoop | None = None  # pylint: disable=invalid-name
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop serving sync callers, starting it on first use.
 
+    The loop runs forever in a daemon thread, so connections opened on it
+    outlive each sync call instead of being tied to a loop that
+    ``asyncio.run`` has already closed.
+
+    Returns:
+        The running background event loop.
+    """
+    global _background_loop  # pylint: disable=global-statement
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="bootstrap-loop", daemon=True).start()
+            _background_loop = loop
+    return _background_loop
 
-async def _init_database_connection(config: AppConfig) -> aiosqlite.Connection:
-    """Initialize database connection with migrations.
+
+def run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the background loop and wait for its result.
+
+    Sync callers must use this for any awaitable that touches the shared
+    container, so its database connections always run on the loop that
+    created them.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+
+    Raises:
+        RuntimeError: If called from within a running event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+    coro.close()
+    raise RuntimeError("Blocking on the background loop from inside an event loop would deadlock; await instead")
+
+
+async def _init_database_pool(config: AppConfig) -> SQLiteConnectionPool:
+    """Initialize the database connection pool with migrations.
 
     Args:
         config: Application configuration.
 
     Returns:
-        Initialized aiosqlite connection.
+        Initialized connection pool.
     """
-    connection = await aiosqlite.connect(config.database_path)
-    connection.row_factory = aiosqlite.Row
+    pool = await SQLiteConnectionPool.open(config.database_path)
 
-    migrator = AsyncDatabaseMigrator(connection)
+    migrator = AsyncDatabaseMigrator(pool.writer)
     await migrator.migrate()
 
-    logger.info("Database connection initialized and migrated")
-    return connection
+    logger.info("Database connection pool initialized and migrated")
+    return pool
 
 
 async def build_container(*, config: AppConfig | None = None) -> Container:
@@ -46,10 +98,10 @@ async def build_container(*, config: AppConfig | None = None) -> Container:
     configure_logging()
     resolved_config = config or get_config()
 
-    connection = await _init_database_connection(resolved_config)
+    pool = await _init_database_pool(resolved_config)
 
     container = Container(config=resolved_config)
-    container.set_database_connection(connection)
+    container.set_database_pool(pool)
 
     logger.info("Container initialized")
     return container
@@ -58,34 +110,69 @@ async def build_container(*, config: AppConfig | None = None) -> Container:
 def get_container(*, config: AppConfig | None = None) -> Container:  # pylint: disable=global-statement
     """Get a shared container instance (sync wrapper).
 
+    Only usable outside a running event loop (e.g. scripts); async code must
+    use ``get_container_async`` instead. The container is built on the
+    background loop used by ``run_sync``.
+
     Args:
         config: Optional configuration override.
 
     Returns:
         Shared container instance.
+
+    Raises:
+        RuntimeError: If called from within a running event loop (raised by
+            ``run_sync``).
     """
     global _container  # pylint: disable=global-statement
     if _container is None:
-        _container = asyncio.run(build_container(config=config))
+        _container = run_sync(get_container_async(config=config))
     return _container
 
 
 async def get_container_async(*, config: AppConfig | None = None) -> Container:
     """Get a shared container instance (async).
 
+    Concurrent first calls share one build, even from different event loops:
+    the first caller builds the container and the others await its result.
+    A failed build is not cached, so the next call retries.
+
     Args:
         config: Optional configuration override.
 
     Returns:
         Shared container instance.
     """
-    global _container  # pylint: disable=global-statement
-    if _container is None:
-        _container = await build_container(config=config)
-    return _container
+    global _container, _container_build  # pylint: disable=global-statement
+    if _container is not None:
+        return _container
+
+    with _container_build_lock:
+        build = _container_build
+        if build is None:
+            build = _container_build = Future()
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        return await asyncio.wrap_future(build)
+
+    try:
+        container = await build_container(config=config)
+    except BaseException as exc:
+        with _container_build_lock:
+            _container_build = None
+        build.set_exception(exc)
+        raise
+    _container = container
+    build.set_result(container)
+    return container
 
 
 def reset_container() -> None:
     """Reset the shared container instance."""
-    global _container  # pylint: disable=global-statement
-    _container = None
+    global _container, _container_build  # pylint: disable=global-statement
+    with _container_build_lock:
+        _container = None
+        _container_build = None
@@ -3,6 +3,8 @@
 # pylint: disable=duplicate-code
 # TECH-DEBT-001: Duplicate provider field definitions with providers.py
 
+from functools import cached_property, lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,7 +13,12 @@ from src.config.providers import AgentaAIConfig, Mem0Config, ProviderConfig
 
 
 class AppConfig(BaseSettings):
-    """Root application configuration aggregating all settings."""
+    """Root application configuration aggregating all settings.
+
+    Fields are validated once here; the sub-configuration views are built
+    with ``model_construct`` so they neither re-validate the values nor
+    read the environment and ``.env`` file again.
+    """
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -63,57 +70,61 @@ class AppConfig(BaseSettings):
         description="Whether Mem0 memory integration is enabled",
     )
 
-    @property
+    @cached_property
     def database_config(self) -> DatabaseConfig:
         """Get database configuration subset.
 
         Returns:
             Database configuration with path.
         """
-        return DatabaseConfig(path=self.database_path)
+        return DatabaseConfig.model_construct(path=self.database_path)
 
-    @property
+    @cached_property
     def provider_config(self) -> ProviderConfig:
         """Get provider configuration subset.
 
         Returns:
             Provider configuration with URLs and API keys.
         """
-        return ProviderConfig(
+        return ProviderConfig.model_construct(
             ollama_base_url=self.ollama_base_url,
             ollama_model=self.ollama_model,
             openrouter_api_key=self.openrouter_api_key,
             zai_api_key=self.zai_api_key,
         )
 
-    @property
+    @cached_property
     def agenta_config(self) -> AgentaAIConfig:
         """Get AgentaAI configuration subset.
 
         Returns:
             AgentaAI configuration with API key and base URL.
         """
-        return AgentaAIConfig(
+        return AgentaAIConfig.model_construct(
             api_key=self.agenta_api_key,
             base_url=self.agenta_base_url,
         )
 
-    @property
+    @cached_property
     def mem0_config(self) -> Mem0Config:
         """Get Mem0 configuration subset.
 
         Returns:
             Mem0 configuration with base URL and enabled flag.
         """
-        return Mem0Config(
+        return Mem0Config.model_construct(
             base_url=self.mem0_base_url,
             enabled=self.mem0_enabled,
         )
 
 
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
     """Get the application configuration singleton.
 
+    The configuration is loaded once; call ``get_config.cache_clear()`` to
+    reload it (e.g. after changing environment variables in tests).
+
     Returns:
         AppConfig instance loaded from environment variables.
     """
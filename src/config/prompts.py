@@ -1,13 +1,26 @@
 """Prompt configuration for chat interactions."""
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import ClassVar
+
+from src.domain.models.message_role import MessageRole
+from src.domain.models.provider_message import ProviderMessage
 
 DEFAULT_SYSTEM_PROMPT = (
     "You are a helpful assistant in a cleanly layered chat application. Answer clearly, be concise, and avoid unsafe content."
 )
 
+DEFAULT_PROMPT_VARIANTS: Mapping[str, str] = MappingProxyType(
+    {
+        "concise": "Be direct and keep responses brief.",
+        "explanatory": "Explain reasoning step by step with examples.",
+    }
+)
+
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PromptConfig:
     """Configuration for system prompts and variants.
 
@@ -16,23 +29,35 @@ class PromptConfig:
         variants: Named prompt variants for specialized behaviors.
     """
 
+    _default: ClassVar["PromptConfig | None"] = None
+
     system_prompt: str
-    variants: dict[str, str]
+    variants: Mapping[str, str]
+    _resolved: dict[str | None, str] = field(init=False, repr=False, compare=False)
+    _system_messages: dict[str | None, ProviderMessage] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the variant lookup tables used by the resolve methods."""
+        object.__setattr__(self, "_resolved", {**self.variants, None: self.system_prompt})
+        object.__setattr__(
+            self,
+            "_system_messages",
+            {key: ProviderMessage(role=MessageRole.SYSTEM, content=prompt) for key, prompt in self._resolved.items()},
+        )
 
     @classmethod
     def default(cls) -> "PromptConfig":
-        """Create a default prompt configuration.
+        """Get the shared default prompt configuration.
 
         Returns:
             PromptConfig with default prompts.
         """
-        return cls(
-            system_prompt=DEFAULT_SYSTEM_PROMPT,
-            variants={
-                "concise": "Be direct and keep responses brief.",
-                "explanatory": "Explain reasoning step by step with examples.",
-            },
-        )
+        if cls._default is None:
+            cls._default = cls(
+                system_prompt=DEFAULT_SYSTEM_PROMPT,
+                variants=DEFAULT_PROMPT_VARIANTS,
+            )
+        return cls._default
 
     def resolve_system_prompt(self, variant: str | None = None) -> str:
         """Resolve the system prompt for a given variant.
@@ -43,7 +68,15 @@ class PromptConfig:
         Returns:
             The resolved system prompt string.
         """
-        if variant is None:
-            return self.system_prompt
+        return self._resolved.get(variant, self.system_prompt)
 
-        return self.variants.get(variant, self.system_prompt)
+    def resolve_system_provider_message(self, variant: str | None = None) -> ProviderMessage:
+        """Resolve the shared system message for a given variant.
+
+        Args:
+            variant: Optional prompt variant key.
+
+        Returns:
+            The prebuilt system ProviderMessage for the variant.
+        """
+        return self._system_messages.get(variant, self._system_messages[None])
@@ -69,4 +69,4 @@ class Mem0Config(BaseSettings):
     )
 
 
-__all__ = ["ProviderConfig", "AgentaAIConfig", "Mem0Config"]
+__all__ = ["AgentaAIConfig", "Mem0Config", "ProviderConfig"]
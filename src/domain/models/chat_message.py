@@ -1,12 +1,12 @@
 """Domain model for ChatMessage entity."""
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 
 from src.domain.models.message_role import MessageRole
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class ChatMessage:
     """Chat message entity representing messages in conversations."""
 
@@ -42,7 +42,7 @@ class ChatMessage:
             provider=provider,
             role=role,
             content=content,
-            timestamp=datetime.now(),
+            timestamp=datetime.now(UTC),
         )
 
     def to_dict(self) -> dict[str, str | int]:
@@ -55,7 +55,7 @@ class ChatMessage:
             "id": self.id,
             "user_id": self.user_id,
             "provider": self.provider,
-            "role": self.role.value,
+            "role": self.role,
             "content": self.content,
             "timestamp": self.timestamp.isoformat(),
         }
@@ -1,9 +1,9 @@
 """Enumeration for message roles in chat conversations."""
 
-from enum import Enum
+from enum import StrEnum
 
 
-class MessageRole(Enum):
+class MessageRole(StrEnum):
     """Enumeration for message roles in chat conversations."""
 
     USER = "user"
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from src.domain.models.message_role import MessageRole
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class ProviderMessage:
     """Message format for provider communication.
 
@@ -27,4 +27,4 @@ class ProviderMessage:
         Returns:
             Dictionary with 'role' and 'content' keys
         """
-        return {"role": self.role.value, "content": self.content}
+        return {"role": self.role, "content": self.content}
@@ -1,10 +1,10 @@
 """Domain model for User entity."""
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class User:
     """User entity representing application users."""
 
@@ -32,7 +32,7 @@ class User:
         Returns:
             User entity with created_at and updated_at set to now.
         """
-        now = datetime.now()
+        now = datetime.now(UTC)
         return cls(
             id=0,
             username=username,
@@ -46,9 +46,4 @@ class User:
         Returns:
             User entity with updated_at set to current time.
         """
-        return User(
-            id=self.id,
-            username=self.username,
-            created_at=self.created_at,
-            updated_at=datetime.now(),
-        )
+        return replace(self, updated_at=datetime.now(UTC))
@@ -5,6 +5,7 @@ following the Repository pattern.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from src.domain.models.chat_message import ChatMessage
 
@@ -23,6 +24,17 @@ class IMessageRepository(ABC):
             The saved message with assigned ID.
         """
 
+    @abstractmethod
+    async def save_many(self, messages: Sequence[ChatMessage]) -> list[ChatMessage]:
+        """Save several messages to the repository in a single transaction.
+
+        Args:
+            messages: The message entities to save, in order.
+
+        Returns:
+            The saved messages with assigned IDs, in the same order.
+        """
+
     @abstractmethod
     async def find_by_id(self, message_id: int) -> ChatMessage | None:
         """Find a message by ID.
@@ -36,15 +48,38 @@ class IMessageRepository(ABC):
 
     @abstractmethod
     async def find_by_user_id(self, user_id: int, limit: int = 100, offset: int = 0) -> list[ChatMessage]:
-        """Find all messages for a user.
+        """Find the most recent messages for a user.
+
+        Args:
+            user_id: The user ID to search for.
+            limit: Maximum number of messages to return.
+            offset: Number of newest messages to skip.
+
+        Returns:
+            List of messages for the user, ordered by timestamp ascending
+            (oldest to newest).
+        """
+
+    @abstractmethod
+    async def find_by_user_id_before(
+        self,
+        user_id: int,
+        before: ChatMessage,
+        limit: int = 100,
+    ) -> list[ChatMessage]:
+        """Find the messages for a user that precede a given message.
+
+        Use this to page back through history from the oldest message
+        already loaded; unlike an offset, the cost does not grow with depth.
 
         Args:
             user_id: The user ID to search for.
+            before: Message to page back from (exclusive).
             limit: Maximum number of messages to return.
-            offset: Number of messages to skip.
 
         Returns:
-            List of messages for the user, ordered by timestamp descending.
+            Up to ``limit`` messages older than ``before``, ordered by
+            timestamp ascending (oldest to newest).
         """
 
     @abstractmethod
@@ -0,0 +1,63 @@
+"""Read-ahead buffering between a response stream and the Chainlit socket."""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
+from contextlib import suppress
+
+DEFAULT_BUFFER_SIZE = 32
+
+
+class _Done:
+    """Marks the end of the buffered stream."""
+
+
+_DONE = _Done()
+
+
+async def buffered[T](source: AsyncIterable[T], size: int = DEFAULT_BUFFER_SIZE) -> AsyncIterator[T]:
+    """Read ``source`` in a background task while the caller consumes it.
+
+    The producer runs up to ``size`` items ahead, so model generation keeps
+    going while the caller awaits slow writes such as WebSocket frames.
+    Errors raised by ``source``, including non-``Exception`` ones, are
+    re-raised to the caller after the items produced before them. When the
+    caller stops early, the producer is cancelled and awaited, so the
+    source's cleanup has run by the time this generator closes.
+
+    Args:
+        source: Stream to read ahead.
+        size: Maximum number of items held in the buffer.
+
+    Yields:
+        Items from ``source`` in order.
+    """
+    queue: asyncio.Queue[T | _Done] = asyncio.Queue(maxsize=size)
+    error: BaseException | None = None
+
+    async def produce() -> None:
+        nonlocal error
+        iterator = aiter(source)
+        try:
+            async for item in iterator:
+                await queue.put(item)
+        except asyncio.CancelledError:
+            raise
+        # Not swallowed: the consumer re-raises it once the buffer is drained.
+        except BaseException as exc:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+            error = exc
+        finally:
+            # Close a generator source here rather than leaving it to the GC.
+            if isinstance(iterator, AsyncGenerator):
+                await iterator.aclose()
+        await queue.put(_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while not isinstance(item := await queue.get(), _Done):
+            yield item
+        if error is not None:
+            raise error
+    finally:
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
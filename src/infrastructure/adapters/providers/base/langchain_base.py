@@ -1,8 +1,10 @@
 """Base LangChain provider implementation."""
 
+import asyncio
 from abc import abstractmethod
 from collections.abc import AsyncGenerator, AsyncIterator
 
+import httpx
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import (
     AIMessage,
@@ -11,10 +13,23 @@ from langchain_core.messages import (
     SystemMessage,
 )
 
+from src.domain.errors.exceptions import ProviderError
 from src.domain.interfaces.provider import Provider
 from src.domain.models.message_role import MessageRole
 from src.domain.models.provider_message import ProviderMessage
 
+DEFAULT_MAX_CONCURRENCY = 8
+# Model chunks are joined into pieces of about this many characters...
+DEFAULT_BUFFER_CHARS = 64
+# ...unless the oldest buffered text has waited this long (seconds).
+DEFAULT_BUFFER_DELAY = 0.05
+
+_ROLE_TO_LC: dict[MessageRole, type[HumanMessage | SystemMessage | AIMessage]] = {
+    MessageRole.USER: HumanMessage,
+    MessageRole.ASSISTANT: AIMessage,
+    MessageRole.SYSTEM: SystemMessage,
+}
+
 
 class BaseLangChainProvider(Provider):
     """Base class for LangChain-based LLM providers.
@@ -24,16 +39,36 @@ class BaseLangChainProvider(Provider):
     and streaming.
 
     Subclasses must provide the LangChain chat model instance and implement
-    the name and model properties.
+    the name and model properties. Client-library exceptions listed in
+    ``_provider_errors`` are translated into ProviderError; subclasses may
+    extend the tuple with their own client errors.
     """
 
-    def __init__(self, llm: BaseChatModel) -> None:
+    _provider_errors: tuple[type[Exception], ...] = (httpx.HTTPError,)
+
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        *,
+        buffer_chars: int = DEFAULT_BUFFER_CHARS,
+        buffer_delay: float = DEFAULT_BUFFER_DELAY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
         """Initialize the provider with a LangChain chat model.
 
         Args:
             llm: Configured LangChain chat model instance
+            buffer_chars: Size at which buffered model chunks are yielded as
+                one piece; 1 yields every chunk as it arrives
+            buffer_delay: Age, in seconds, after which buffered text is
+                yielded with the next chunk even if it is still short
+            max_concurrency: Maximum number of model requests in flight;
+                further conversations wait for a free slot
         """
         self._llm = llm
+        self._buffer_chars = buffer_chars
+        self._buffer_delay = buffer_delay
+        self._request_slots = asyncio.Semaphore(max_concurrency)
 
     def stream_response(
         self,
@@ -59,17 +94,48 @@ class BaseLangChainProvider(Provider):
     ) -> AsyncGenerator[str, None]:
         """Stream the response from the LangChain model.
 
+        Chunks are joined until ``buffer_chars`` is reached or the oldest of
+        them is ``buffer_delay`` old. The age is checked when a chunk
+        arrives, so no timer task runs per chunk; a pause in generation
+        holds the buffer until the next chunk or the end of the stream.
+
         Args:
             messages: List of messages forming conversation context
             system_prompt: Optional system prompt to guide model's behavior
 
         Yields:
             Chunks of response as they become available
+
+        Raises:
+            ProviderError: If the underlying client fails while streaming
         """
         lc_messages = self._convert_messages(messages, system_prompt)
-        async for chunk in self._llm.astream(lc_messages):
-            if isinstance(chunk, AIMessageChunk) and chunk.content:
-                yield str(chunk.content)
+        # Drop the provider messages before the long generation so they can
+        # be reclaimed if the caller holds no other reference.
+        del messages, system_prompt
+        clock = asyncio.get_running_loop().time
+        buffer: list[str] = []
+        buffered = 0
+        flush_at = 0.0
+        try:
+            async with self._request_slots:
+                async for chunk in self._llm.astream(lc_messages):
+                    if isinstance(chunk, AIMessageChunk) and chunk.content:
+                        text = str(chunk.content)
+                        if not buffer:
+                            flush_at = clock() + self._buffer_delay
+                        buffer.append(text)
+                        buffered += len(text)
+                        if buffered >= self._buffer_chars or clock() >= flush_at:
+                            yield "".join(buffer)
+                            buffer.clear()
+                            buffered = 0
+        except self._provider_errors as exc:
+            if buffer:
+                yield "".join(buffer)
+            raise ProviderError(f"{self.name} stream failed: {exc}") from exc
+        if buffer:
+            yield "".join(buffer)
 
     async def complete(
         self,
@@ -78,6 +144,9 @@ class BaseLangChainProvider(Provider):
     ) -> str:
         """Get complete response from the LangChain model.
 
+        The response is streamed and joined once, so streaming and
+        completion share one transport path.
+
         Args:
             messages: List of messages forming the conversation context
             system_prompt: Optional system prompt to guide the model's behavior
@@ -85,10 +154,10 @@ class BaseLangChainProvider(Provider):
         Returns:
             The complete response as a single string
 
+        Raises:
+            ProviderError: If the underlying client fails
         """
-        lc_messages = self._convert_messages(messages, system_prompt)
-        response = await self._llm.ainvoke(lc_messages)
-        return str(response.content)
+        return "".join([chunk async for chunk in self._stream_response_impl(messages, system_prompt)])
 
     def _convert_messages(
         self,
@@ -104,21 +173,8 @@ class BaseLangChainProvider(Provider):
         Returns:
             List of LangChain message objects
         """
-        lc_messages: list[HumanMessage | SystemMessage | AIMessage] = []
-
-        if system_prompt:
-            lc_messages.append(SystemMessage(content=system_prompt))
-
-        for msg in messages:
-            match msg.role:
-                case MessageRole.USER:
-                    lc_messages.append(HumanMessage(content=msg.content))
-                case MessageRole.ASSISTANT:
-                    lc_messages.append(AIMessage(content=msg.content))
-                case MessageRole.SYSTEM:
-                    lc_messages.append(SystemMessage(content=msg.content))
-
-        return lc_messages
+        head: list[HumanMessage | SystemMessage | AIMessage] = [SystemMessage(content=system_prompt)] if system_prompt else []
+        return head + [_ROLE_TO_LC[msg.role](content=msg.content) for msg in messages]
 
     @property
     @abstractmethod
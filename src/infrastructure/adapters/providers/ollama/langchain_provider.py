@@ -1,11 +1,25 @@
 """Ollama provider implementation using LangChain."""
 
+import httpx
 from langchain_ollama import ChatOllama
+from ollama import RequestError, ResponseError
 
 from src.infrastructure.adapters.providers.base.langchain_base import (
+    DEFAULT_BUFFER_CHARS,
+    DEFAULT_BUFFER_DELAY,
+    DEFAULT_MAX_CONCURRENCY,
     BaseLangChainProvider,
 )
 
+# Chat turns are usually further apart than httpx's 5 s default keep-alive
+# expiry; holding idle connections longer lets the next turn skip the
+# TCP/TLS handshake. Only connecting is bounded: a cold model load can
+# delay the first token for minutes.
+_CLIENT_KWARGS = {
+    "limits": httpx.Limits(max_connections=64, max_keepalive_connections=16, keepalive_expiry=120.0),
+    "timeout": httpx.Timeout(None, connect=10.0),
+}
+
 
 class OllamaLangChainProvider(BaseLangChainProvider):
     """Ollama provider using LangChain's ChatOllama.
@@ -14,15 +28,33 @@ class OllamaLangChainProvider(BaseLangChainProvider):
     native Ollama integration.
     """
 
-    def __init__(self, base_url: str, model: str) -> None:
+    _provider_errors = (*BaseLangChainProvider._provider_errors, RequestError, ResponseError)
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        *,
+        buffer_chars: int = DEFAULT_BUFFER_CHARS,
+        buffer_delay: float = DEFAULT_BUFFER_DELAY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
         """Initialize the Ollama LangChain provider.
 
         Args:
             base_url: Base URL for Ollama API (e.g., http://localhost:11434)
             model: Model name to use (e.g., llama3.1)
+            buffer_chars: Size at which buffered chunks are yielded
+            buffer_delay: Age, in seconds, after which buffered text is yielded
+            max_concurrency: Maximum number of model requests in flight
         """
-        llm = ChatOllama(base_url=base_url, model=model)
-        super().__init__(llm)
+        llm = ChatOllama(base_url=base_url, model=model, client_kwargs=dict(_CLIENT_KWARGS))
+        super().__init__(
+            llm,
+            buffer_chars=buffer_chars,
+            buffer_delay=buffer_delay,
+            max_concurrency=max_concurrency,
+        )
         self._model_name = model
 
     @property
@@ -2,6 +2,10 @@
 
 This module provides centralized dependency injection and management
 for the application, following Clean Architecture principles.
+
+Adapters that pull in heavy third-party packages (Chainlit, LangChain) are
+imported inside the getters that build them, so importing the container
+does not load them until they are first needed.
 """
 
 import aiosqlite
@@ -15,9 +19,7 @@ from src.domain.interfaces.frontend_adapter import IMessageAdapter, ISessionAdap
 from src.domain.interfaces.provider import Provider
 from src.domain.repositories.message_repository import IMessageRepository
 from src.domain.repositories.user_repository import IUserRepository
-from src.infrastructure.adapters.chainlit.message_adapter import ChainlitMessageAdapter
-from src.infrastructure.adapters.chainlit.session_adapter import ChainlitSessionAdapter
-from src.infrastructure.adapters.providers.factory import build_provider
+from src.infrastructure.database.pool import SQLiteConnectionPool
 from src.infrastructure.repositories.sqlite_message_repository import (
     SQLiteMessageRepository,
 )
@@ -33,14 +35,29 @@ class Container:  # pylint: disable=too-many-instance-attributes
     keeping the architecture simple while maintaining testability.
     """
 
+    __slots__ = (
+        "_config",
+        "_db_pool",
+        "_get_system_prompt_use_case",
+        "_load_history_use_case",
+        "_message_adapter",
+        "_message_repository",
+        "_prompt_config",
+        "_provider",
+        "_send_message_use_case",
+        "_session_adapter",
+        "_user_repository",
+    )
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         *,
         config: AppConfig,
-        database_connection: aiosqlite.Connection | None = None,
+        database_pool: SQLiteConnectionPool | None = None,
         message_repository: IMessageRepository | None = None,
         user_repository: IUserRepository | None = None,
         provider: Provider | None = None,
+        prompt_config: PromptConfig | None = None,
         session_adapter: ISessionAdapter | None = None,
         message_adapter: IMessageAdapter | None = None,
     ) -> None:
@@ -48,19 +65,21 @@ class Container:  # pylint: disable=too-many-instance-attributes
 
         Args:
             config: Application configuration.
-            database_connection: Optional database connection override.
+            database_pool: Optional database connection pool override.
             message_repository: Optional message repository override.
             user_repository: Optional user repository override.
             provider: Optional provider override.
+            prompt_config: Optional prompt configuration override.
             session_adapter: Optional session adapter override.
             message_adapter: Optional message adapter override.
         """
         self._config = config
 
-        self._db_connection = database_connection
+        self._db_pool = database_pool
         self._message_repository = message_repository
         self._user_repository = user_repository
         self._provider = provider
+        self._prompt_config = prompt_config
         self._session_adapter = session_adapter
         self._message_adapter = message_adapter
 
@@ -68,26 +87,42 @@ class Container:  # pylint: disable=too-many-instance-attributes
         self._get_system_prompt_use_case: GetSystemPromptUseCase | None = None
         self._send_message_use_case: SendMessageUseCase | None = None
 
+    def set_database_pool(self, pool: SQLiteConnectionPool) -> None:
+        """Set the database connection pool.
+
+        Args:
+            pool: Connection pool to use.
+        """
+        self._db_pool = pool
+
+    def get_database_pool(self) -> SQLiteConnectionPool:
+        """Get database connection pool.
+
+        Returns:
+            Database connection pool instance.
+
+        Raises:
+            RuntimeError: If the database pool is not initialized.
+        """
+        if self._db_pool is None:
+            raise RuntimeError("Database pool not initialized. Call set_database_pool() first or use async init.")
+        return self._db_pool
+
     def set_database_connection(self, connection: aiosqlite.Connection) -> None:
-        """Set the database connection.
+        """Set a single database connection used for reads and writes.
 
         Args:
             connection: aiosqlite connection to use.
         """
-        self._db_connection = connection
+        self._db_pool = SQLiteConnectionPool(writer=connection)
 
     def get_database_connection(self) -> aiosqlite.Connection:
-        """Get database connection.
+        """Get the writer database connection.
 
         Returns:
             Database connection instance.
-
-        Raises:
-            RuntimeError: If database connection is not initialized.
         """
-        if self._db_connection is None:
-            raise RuntimeError("Database connection not initialized. Call set_database_connection() first or use async init.")
-        return self._db_connection
+        return self.get_database_pool().writer
 
     def get_message_repository(self) -> IMessageRepository:
         """Get message repository, creating if needed.
@@ -97,7 +132,7 @@ class Container:  # pylint: disable=too-many-instance-attributes
         """
         if self._message_repository is None:
             self._message_repository = SQLiteMessageRepository(
-                self.get_database_connection(),
+                self.get_database_pool(),
             )
         return self._message_repository
 
@@ -109,7 +144,7 @@ class Container:  # pylint: disable=too-many-instance-attributes
         """
         if self._user_repository is None:
             self._user_repository = SQLiteUserRepository(
-                self.get_database_connection(),
+                self.get_database_pool(),
             )
         return self._user_repository
 
@@ -123,6 +158,10 @@ class Container:  # pylint: disable=too-many-instance-attributes
             Provider instance.
         """
         if self._provider is None:
+            from src.infrastructure.adapters.providers.factory import (  # pylint: disable=import-outside-toplevel
+                build_provider,
+            )
+
             self._provider = build_provider(
                 config=self._config.provider_config,
                 name=name,
@@ -130,12 +169,14 @@ class Container:  # pylint: disable=too-many-instance-attributes
         return self._provider
 
     def get_prompt_config(self) -> PromptConfig:
-        """Get prompt configuration.
+        """Get prompt configuration, defaulting to the shared default.
 
         Returns:
             Prompt configuration instance.
         """
-        return PromptConfig.default()
+        if self._prompt_config is None:
+            self._prompt_config = PromptConfig.default()
+        return self._prompt_config
 
     def get_session_adapter(self) -> ISessionAdapter:
         """Get session adapter, creating if needed.
@@ -144,6 +185,10 @@ class Container:  # pylint: disable=too-many-instance-attributes
             Session adapter instance.
         """
         if self._session_adapter is None:
+            from src.infrastructure.adapters.chainlit.session_adapter import (  # pylint: disable=import-outside-toplevel
+                ChainlitSessionAdapter,
+            )
+
             self._session_adapter = ChainlitSessionAdapter(
                 user_repository=self.get_user_repository(),
             )
@@ -156,6 +201,10 @@ class Container:  # pylint: disable=too-many-instance-attributes
             Message adapter instance.
         """
         if self._message_adapter is None:
+            from src.infrastructure.adapters.chainlit.message_adapter import (  # pylint: disable=import-outside-toplevel
+                ChainlitMessageAdapter,
+            )
+
             self._message_adapter = ChainlitMessageAdapter()
         return self._message_adapter
 
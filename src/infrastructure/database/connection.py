@@ -5,8 +5,8 @@ for the application.
 """
 
 import asyncio
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager, suppress
 from logging import getLogger
 from pathlib import Path
 from typing import Any
@@ -16,17 +16,39 @@ import aiosqlite
 from src.config.app import AppConfig, get_config
 from src.domain.errors.exceptions import StorageError
 from src.infrastructure.database.migrator import AsyncDatabaseMigrator
+from src.infrastructure.database.pool import open_connection
 
 logger = getLogger(__name__)
 
 _GLOBAL_CONFIG: AppConfig | None = None
-_GLOBAL_CONNECTION: aiosqlite.Connection | None = None
+_CONNECTIONS: dict[str, aiosqlite.Connection] = {}
 _CONNECTION_LOCK = asyncio.Lock()
 
 
+def _resolve_config(config: AppConfig | None) -> AppConfig:
+    """Resolve the configuration for a module-level connection call.
+
+    The first configuration seen becomes the default for later calls that
+    pass none.
+
+    Args:
+        config: Optional application configuration override.
+
+    Returns:
+        Configuration to use.
+    """
+    global _GLOBAL_CONFIG  # pylint: disable=global-statement
+    if _GLOBAL_CONFIG is None:
+        _GLOBAL_CONFIG = config or get_config()
+    return config or _GLOBAL_CONFIG
+
+
 async def init_database(config: AppConfig | None = None) -> aiosqlite.Connection:
     """Initialize the database schema (async).
 
+    One connection is kept per database path. Once it exists it is
+    returned without taking the initialization lock.
+
     Args:
         config: Optional application configuration override.
 
@@ -36,32 +58,31 @@ async def init_database(config: AppConfig | None = None) -> aiosqlite.Connection
     Raises:
         StorageError: If database connection or migrations fail.
     """
-    global _GLOBAL_CONFIG, _GLOBAL_CONNECTION  # pylint: disable=global-statement
+    database_path = _resolve_config(config).database_path
+    connection = _CONNECTIONS.get(database_path)
+    if connection is not None:
+        return connection
 
     async with _CONNECTION_LOCK:
-        if _GLOBAL_CONFIG is None:
-            _GLOBAL_CONFIG = config or get_config()
-        if _GLOBAL_CONFIG is None:
-            logger.error("Database configuration not initialized")
-            raise StorageError("Database configuration not initialized")
-
-        if _GLOBAL_CONNECTION is None:
+        connection = _CONNECTIONS.get(database_path)
+        if connection is None:
             try:
-                _GLOBAL_CONNECTION = await aiosqlite.connect(
-                    _GLOBAL_CONFIG.database_path,
-                )
-                _GLOBAL_CONNECTION.row_factory = aiosqlite.Row
-
-                migrator = AsyncDatabaseMigrator(_GLOBAL_CONNECTION, Path("migrations"))
-                await migrator.migrate()
+                connection = await open_connection(database_path)
+                try:
+                    migrator = AsyncDatabaseMigrator(connection, Path("migrations"))
+                    await migrator.migrate()
+                except BaseException:
+                    # Not cached, so nothing else would ever close it.
+                    with suppress(aiosqlite.Error):
+                        await connection.close()
+                    raise
                 logger.info("Database migrations completed")
             except aiosqlite.Error as exc:
                 logger.exception("Database initialization failed")
                 raise StorageError(f"Database initialization failed: {exc}") from exc
+            _CONNECTIONS[database_path] = connection
 
-    if _GLOBAL_CONNECTION is None:
-        raise StorageError("Database connection not initialized after init")
-    return _GLOBAL_CONNECTION
+    return connection
 
 
 async def get_connection(config: AppConfig | None = None) -> aiosqlite.Connection:
@@ -73,76 +94,123 @@ async def get_connection(config: AppConfig | None = None) -> aiosqlite.Connectio
     Returns:
         aiosqlite connection object.
     """
-    if _GLOBAL_CONNECTION is None:
-        return await init_database(config)
-    return _GLOBAL_CONNECTION
+    return await init_database(config)
 
 
 async def close_connection() -> None:
-    """Close the global database connection."""
-    global _GLOBAL_CONNECTION  # pylint: disable=global-statement
+    """Close all module-level database connections."""
     async with _CONNECTION_LOCK:
-        if _GLOBAL_CONNECTION is not None:
-            await _GLOBAL_CONNECTION.close()
-            _GLOBAL_CONNECTION = None
+        while _CONNECTIONS:
+            _, connection = _CONNECTIONS.popitem()
+            await connection.close()
 
 
 class DatabaseConnection:
     """Manages SQLite database connections using aiosqlite."""
 
-    def __init__(self, config: AppConfig) -> None:
+    __slots__ = ("_connection", "_lock", "_migration", "_migrations_dir", "config")
+
+    def __init__(self, config: AppConfig, migrations_dir: Path | None = None) -> None:
         """Initialize database connection manager.
 
         Args:
             config: Database configuration.
+            migrations_dir: Directory containing SQL migration files.
         """
         self.config = config
+        self._migrations_dir = migrations_dir if migrations_dir is not None else Path("migrations")
         self._connection: aiosqlite.Connection | None = None
+        self._migration: asyncio.Task[None] | None = None
         self._lock = asyncio.Lock()
 
     @property
     def connection(self) -> aiosqlite.Connection:
         """Access the underlying aiosqlite connection.
 
+        Unlike ``acquire``, this cannot wait, so it refuses to hand out the
+        connection while the background migration is still running.
+
         Returns:
             aiosqlite connection object.
 
         Raises:
-            StorageError: If connection is not initialized.
+            StorageError: If the connection is not initialized, migrations are
+                still running, or migrations failed.
         """
         if self._connection is None:
             raise StorageError("Database connection not initialized. Call init() first.")
+        if self._migration is not None:
+            if not self._migration.done():
+                raise StorageError("Database migrations still running. Await acquire() first.")
+            self._migration.result()
+            self._migration = None
         return self._connection
 
     async def init(self) -> None:
-        """Initialize the database connection and run migrations.
+        """Open the database connection and start migrations in the background.
+
+        Migrations run as a task on the new connection so startup does not
+        wait for them; ``acquire`` and the query helpers wait for that task
+        before touching the database.
 
         Raises:
-            StorageError: If database initialization fails.
+            StorageError: If the database connection cannot be opened.
         """
         async with self._lock:
             if self._connection is None:
                 try:
-                    self._connection = await aiosqlite.connect(
-                        self.config.database_path,
-                    )
-                    self._connection.row_factory = aiosqlite.Row
-
-                    migrator = AsyncDatabaseMigrator(
-                        self._connection,
-                        Path("migrations"),
-                    )
-                    await migrator.migrate()
-                    logger.info("Database connection initialized and migrated")
+                    self._connection = await open_connection(self.config.database_path)
                 except aiosqlite.Error as exc:
                     logger.exception("Failed to initialize database connection")
                     raise StorageError(f"Failed to initialize database connection: {exc}") from exc
+                self._migration = asyncio.create_task(self._migrate(self._connection))
+                self._migration.add_done_callback(self._report_migration_failure)
 
-    @asynccontextmanager
-    async def get_connection(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Get a database connection (async context manager).
+    async def _migrate(self, connection: aiosqlite.Connection) -> None:
+        """Run pending migrations on ``connection``.
 
-        Yields:
+        Args:
+            connection: Connection to migrate.
+
+        Raises:
+            StorageError: If migrations fail.
+        """
+        try:
+            await AsyncDatabaseMigrator(connection, self._migrations_dir).migrate()
+            logger.info("Database connection initialized and migrated")
+        except aiosqlite.Error as exc:
+            raise StorageError(f"Failed to initialize database connection: {exc}") from exc
+
+    @staticmethod
+    def _report_migration_failure(task: asyncio.Task[None]) -> None:
+        """Log a failed background migration as soon as it finishes.
+
+        Retrieving the exception here also means a failure nobody awaits is
+        reported in the log instead of as "Task exception was never retrieved".
+
+        Args:
+            task: Finished migration task.
+        """
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.error("Background database migration failed: %s", exc, exc_info=exc)
+
+    async def _wait_for_migration(self) -> None:
+        """Wait for the background migration started by ``init``.
+
+        The task is dropped once it succeeds, so later calls return at once.
+        A failed migration keeps raising on every call.
+
+        Raises:
+            StorageError: If migrations failed.
+        """
+        if self._migration is not None:
+            await self._migration
+            self._migration = None
+
+    async def acquire(self) -> aiosqlite.Connection:
+        """Get the database connection, initializing it on first use.
+
+        Returns:
             aiosqlite connection object.
 
         Raises:
@@ -152,8 +220,25 @@ class DatabaseConnection:
             await self.init()
         if self._connection is None:
             raise StorageError("Database connection not initialized after init")
+        await self._wait_for_migration()
+        return self._connection
+
+    @asynccontextmanager
+    async def get_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Get a database connection (async context manager).
+
+        Kept for compatibility; prefer ``acquire``, which avoids building a
+        context manager per call.
+
+        Yields:
+            aiosqlite connection object.
+
+        Raises:
+            StorageError: If connection fails.
+        """
+        connection = await self.acquire()
         try:
-            yield self._connection
+            yield connection
         except aiosqlite.Error as exc:
             logger.exception("Database connection error")
             raise StorageError(f"Database connection error: {exc}") from exc
@@ -161,6 +246,10 @@ class DatabaseConnection:
     async def close(self) -> None:
         """Close the database connection."""
         async with self._lock:
+            if self._migration is not None:
+                with suppress(StorageError):
+                    await self._migration
+                self._migration = None
             if self._connection is not None:
                 await self._connection.close()
                 self._connection = None
@@ -182,8 +271,9 @@ class DatabaseConnection:
             Cursor object.
 
         Raises:
-            StorageError: If query execution fails.
+            StorageError: If migrations or query execution fail.
         """
+        await self._wait_for_migration()
         try:
             cursor = await self.connection.execute(query, params)
             if commit:
@@ -193,29 +283,64 @@ class DatabaseConnection:
             logger.exception("Query execution failed")
             raise StorageError(f"Query execution failed: {exc}") from exc
 
+    async def execute_many(
+        self,
+        query: str,
+        params_seq: Iterable[tuple[Any, ...]],
+    ) -> None:
+        """Execute a SQL statement once per parameter tuple and commit once.
+
+        The whole batch runs in a single call on the connection's worker
+        thread instead of one round trip per row.
+
+        Args:
+            query: SQL statement string.
+            params_seq: Parameters for each execution.
+
+        Raises:
+            StorageError: If migrations or query execution fail.
+        """
+        await self._wait_for_migration()
+        try:
+            await self.connection.executemany(query, params_seq)
+            await self.connection.commit()
+        except aiosqlite.Error as exc:
+            logger.exception("Batch execution failed")
+            raise StorageError(f"Batch execution failed: {exc}") from exc
+
     async def fetch_all(
         self,
         query: str,
         params: tuple[Any, ...] = (),
-    ) -> list[dict[str, Any]]:
+    ) -> list[aiosqlite.Row]:
         """Fetch all rows from a query.
 
+        Rows are returned as-is rather than copied into dictionaries; they
+        support access both by column name and by index.
+
         Args:
             query: SQL query string.
             params: Query parameters.
 
         Returns:
-            List of row dictionaries.
+            List of rows.
+
+        Raises:
+            StorageError: If migrations or query execution fail.
         """
-        cursor = await self.execute(query, params)
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        await self._wait_for_migration()
+        try:
+            rows = await self.connection.execute_fetchall(query, params)
+        except aiosqlite.Error as exc:
+            logger.exception("Query execution failed")
+            raise StorageError(f"Query execution failed: {exc}") from exc
+        return list(rows)
 
     async def fetch_one(
         self,
         query: str,
         params: tuple[Any, ...] = (),
-    ) -> dict[str, Any] | None:
+    ) -> aiosqlite.Row | None:
         """Fetch one row from a query.
 
         Args:
@@ -223,8 +348,16 @@ class DatabaseConnection:
             params: Query parameters.
 
         Returns:
-            Row dictionary or None if not found.
+            Row or None if not found.
+
+        Raises:
+            StorageError: If migrations or query execution fail.
         """
-        cursor = await self.execute(query, params)
-        row = await cursor.fetchone()
-        return dict(row) if row else None
+        await self._wait_for_migration()
+        try:
+            async with self.connection.execute(query, params) as cursor:
+                row = await cursor.fetchone()
+        except aiosqlite.Error as exc:
+            logger.exception("Query execution failed")
+            raise StorageError(f"Query execution failed: {exc}") from exc
+        return row
@@ -9,7 +9,6 @@ from pathlib import Path
 from src.config.app import AppConfig
 from src.domain.errors.exceptions import StorageError
 from src.infrastructure.database.connection import DatabaseConnection
-from src.infrastructure.database.migrator import AsyncDatabaseMigrator
 
 _DEFAULT_MIGRATIONS_DIR: Path = Path("migrations")
 logger = getLogger(__name__)
@@ -34,13 +33,8 @@ async def initialize_database(
     migrations_path = migrations_dir if migrations_dir is not None else _DEFAULT_MIGRATIONS_DIR
 
     try:
-        connection = DatabaseConnection(config)
-        await connection.init()
-
-        async with connection.get_connection() as conn:
-            migrator = AsyncDatabaseMigrator(conn, migrations_path)
-            await migrator.migrate()
-
+        connection = DatabaseConnection(config, migrations_path)
+        await connection.acquire()
         return connection
     except Exception as exc:
         logger.exception("Database initialization failed")
@@ -1,5 +1,8 @@
 """Database migration manager for SQL-based migrations."""
 
+import asyncio
+import os
+import zlib
 from dataclasses import dataclass
 from datetime import datetime
 from logging import getLogger
@@ -9,13 +12,78 @@ import aiosqlite
 
 from src.config.database import DatabaseConfig
 from src.domain.errors.exceptions import StorageError
+from src.infrastructure.database.pool import open_connection
 
 logger = getLogger(__name__)
 
 DEFAULT_MIGRATIONS_DIR = Path("migrations")
 
+# Directory -> (directory mtime in ns, sorted migration files).
+_MIGRATION_FILES_CACHE: dict[Path, tuple[int, tuple[Path, ...]]] = {}
 
-@dataclass(frozen=True, kw_only=True)
+
+def _list_migration_files(migrations_dir: Path) -> tuple[Path, ...]:
+    """List the migration files in a directory, in application order.
+
+    The listing is cached per directory and reused until the directory's
+    mtime changes, which happens whenever a file is added, removed or
+    renamed in it.
+
+    Args:
+        migrations_dir: Directory containing SQL migration files.
+
+    Returns:
+        Sorted migration file paths, empty if the directory does not exist.
+    """
+    try:
+        mtime = os.stat(migrations_dir).st_mtime_ns
+    except FileNotFoundError:
+        return ()
+
+    cached = _MIGRATION_FILES_CACHE.get(migrations_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with os.scandir(migrations_dir) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".sql") and not entry.name.startswith(".") and entry.is_file()
+        )
+    files = tuple(migrations_dir / name for name in names)
+    _MIGRATION_FILES_CACHE[migrations_dir] = (mtime, files)
+    return files
+
+
+def _schema_fingerprint(migration_files: tuple[Path, ...]) -> int:
+    """Fingerprint a set of migration files for ``PRAGMA user_version``.
+
+    Every file name contributes, so adding a file with a duplicate or lower
+    numeric prefix changes the fingerprint just like adding a newer one.
+
+    Args:
+        migration_files: Sorted migration file paths.
+
+    Returns:
+        CRC32 of the file names as a signed 32-bit integer (user_version's type).
+    """
+    checksum = zlib.crc32("\n".join(path.name for path in migration_files).encode())
+    return checksum - (1 << 32) if checksum >= 1 << 31 else checksum
+
+
+def _read_migration_files(migration_files: list[Path]) -> list[str]:
+    """Read migration files; run in a worker thread to keep the loop free.
+
+    Args:
+        migration_files: Paths to migration SQL files.
+
+    Returns:
+        File contents in the same order.
+    """
+    return [migration_file.read_text() for migration_file in migration_files]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MigrationRecord:
     """Record of applied migration."""
 
@@ -41,34 +109,73 @@ class AsyncDatabaseMigrator:
         self.connection = connection
         self.migrations_dir = migrations_dir
         self._migration_table_name = "schema_migrations"
+        self._migration_table_ready = False
+        self._create_table_sql = f"""
+            CREATE TABLE IF NOT EXISTS {self._migration_table_name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                migration_id TEXT UNIQUE NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        self._select_applied_sql = f"SELECT migration_id FROM {self._migration_table_name}"
+        self._select_history_sql = f"""
+            SELECT id, migration_id, applied_at
+            FROM {self._migration_table_name}
+            ORDER BY id ASC
+        """
 
     async def migrate(self) -> None:
         """Apply all pending migrations.
 
+        After a full run a fingerprint of the migration file names is stored
+        in ``PRAGMA user_version``. When it still matches, the tracking table
+        is not touched at all, so warm starts skip its write transaction and
+        query; any added, removed or renamed file falls back to the
+        applied-set diff. Pending migrations are applied together in a
+        single transaction.
+
         Raises:
             StorageError: If migration fails.
         """
         try:
+            migration_files = _list_migration_files(self.migrations_dir)
+            fingerprint = _schema_fingerprint(migration_files) if migration_files else None
+            if fingerprint is not None and await self._get_schema_version() == fingerprint:
+                logger.debug("Schema already up to date (%d migrations)", len(migration_files))
+                return
+
             await self._ensure_migrations_table()
             applied_migrations = await self._get_applied_migrations()
             pending_migrations = self._get_pending_migrations(applied_migrations)
 
-            for migration_file in pending_migrations:
-                await self._apply_migration(migration_file)
-                logger.info("Applied migration: %s", migration_file.stem)
+            if pending_migrations:
+                await self._apply_migrations(pending_migrations)
+
+            if fingerprint is not None:
+                await self.connection.execute(f"PRAGMA user_version = {fingerprint}")
         except aiosqlite.Error as e:
             raise StorageError(f"Migration failed: {e}") from e
 
+    async def _get_schema_version(self) -> int:
+        """Get the schema version recorded in the database.
+
+        Returns:
+            Value of ``PRAGMA user_version`` (0 if never set).
+        """
+        cursor = await self.connection.execute("PRAGMA user_version")
+        row = await cursor.fetchone()
+        return int(row[0]) if row else 0
+
     async def _ensure_migrations_table(self) -> None:
-        """Create migrations tracking table if it doesn't exist."""
-        await self.connection.execute(f"""
-            CREATE TABLE IF NOT EXISTS {self._migration_table_name} (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                migration_id TEXT UNIQUE NOT NULL,
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        """Create migrations tracking table if it doesn't exist.
+
+        Only the first call on a migrator runs the DDL and its commit.
+        """
+        if self._migration_table_ready:
+            return
+        await self.connection.execute(self._create_table_sql)
         await self.connection.commit()
+        self._migration_table_ready = True
 
     async def _get_applied_migrations(self) -> set[str]:
         """Get set of applied migration IDs.
@@ -76,7 +183,7 @@ class AsyncDatabaseMigrator:
         Returns:
             Set of migration IDs that have been applied.
         """
-        cursor = await self.connection.execute(f"SELECT migration_id FROM {self._migration_table_name}")
+        cursor = await self.connection.execute(self._select_applied_sql)
         rows = await cursor.fetchall()
         return {row[0] for row in rows}
 
@@ -89,44 +196,49 @@ class AsyncDatabaseMigrator:
         Returns:
             List of migration file paths in order.
         """
-        if not self.migrations_dir.exists():
-            return []
-
-        migration_files = sorted(self.migrations_dir.glob("*.sql"))
-
         pending = []
-        for migration_file in migration_files:
+        for migration_file in _list_migration_files(self.migrations_dir):
             migration_id = migration_file.stem
             if migration_id not in applied_migrations:
                 pending.append(migration_file)
 
         return pending
 
-    async def _apply_migration(self, migration_file: Path) -> None:
-        """Apply a single migration file.
+    async def _apply_migrations(self, migration_files: list[Path]) -> None:
+        """Apply migration files and record them in one transaction.
+
+        ``executescript`` commits any open transaction before it runs, so
+        the files and their tracking rows are joined into one script wrapped
+        in ``BEGIN``/``COMMIT``. That costs a single commit for the whole
+        batch, and if any file fails none of them are applied.
 
         Args:
-            migration_file: Path to migration SQL file.
+            migration_files: Paths to migration SQL files, in order.
 
         Raises:
             StorageError: If migration execution fails.
         """
-        migration_id = migration_file.stem
+        migration_ids = [migration_file.stem for migration_file in migration_files]
 
         try:
-            sql_content = migration_file.read_text()
-
-            await self.connection.executescript(sql_content)
+            contents = await asyncio.to_thread(_read_migration_files, migration_files)
 
-            await self.connection.execute(
-                f"INSERT INTO {self._migration_table_name} (migration_id) VALUES (?)",
-                (migration_id,),
-            )
+            script = ["BEGIN;"]
+            for sql_content, migration_id in zip(contents, migration_ids, strict=True):
+                quoted_id = migration_id.replace("'", "''")
+                script.append(sql_content)
+                script.append(f";\nINSERT INTO {self._migration_table_name} (migration_id) VALUES ('{quoted_id}');")
+            script.append("COMMIT;")
 
-            await self.connection.commit()
+            await self.connection.executescript("\n".join(script))
 
         except (OSError, aiosqlite.Error) as e:
-            raise StorageError(f"Failed to apply migration {migration_id}: {e}") from e
+            if self.connection.in_transaction:
+                await self.connection.rollback()
+            raise StorageError(f"Failed to apply migration {', '.join(migration_ids)}: {e}") from e
+
+        for migration_id in migration_ids:
+            logger.info("Applied migration: %s", migration_id)
 
     async def get_migration_history(self) -> list[MigrationRecord]:
         """Get history of applied migrations.
@@ -134,23 +246,11 @@ class AsyncDatabaseMigrator:
         Returns:
             List of migration records in order of application.
         """
-        cursor = await self.connection.execute(f"""
-            SELECT id, migration_id, applied_at
-            FROM {self._migration_table_name}
-            ORDER BY id ASC
-        """)
-        rows = await cursor.fetchall()
-
-        records = []
-        for row in rows:
-            record = MigrationRecord(
-                id=row[0],
-                migration_id=row[1],
-                applied_at=datetime.fromisoformat(row[2]),
-            )
-            records.append(record)
-
-        return records
+        cursor = await self.connection.execute(self._select_history_sql)
+        return [
+            MigrationRecord(id=row_id, migration_id=migration_id, applied_at=datetime.fromisoformat(applied_at))
+            for row_id, migration_id, applied_at in await cursor.fetchall()
+        ]
 
 
 async def run_migrations(
@@ -169,8 +269,7 @@ async def run_migrations(
     if migrations_dir is None:
         migrations_dir = Path("migrations")
     try:
-        connection = await aiosqlite.connect(config.path)
-        connection.row_factory = aiosqlite.Row
+        connection = await open_connection(config.path)
 
         migrator = AsyncDatabaseMigrator(connection, migrations_dir)
         await migrator.migrate()
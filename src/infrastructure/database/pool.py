@@ -0,0 +1,140 @@
+"""Pool of long-lived aiosqlite connections.
+
+aiosqlite runs every operation of a connection on that connection's own
+worker thread, so a single shared connection serializes all queries. The
+pool keeps one writer connection (SQLite allows a single writer at a time)
+plus a few read-only connections so reads can run while a write is pending.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from logging import getLogger
+
+import aiosqlite
+
+from src.infrastructure.database.pragmas import apply_connection_pragmas
+
+logger = getLogger(__name__)
+
+DEFAULT_READER_COUNT = 3
+# Prepared statements kept per connection (sqlite3 defaults to 128). The cache
+# is keyed by SQL text, so repository queries must stay constant strings with
+# bound parameters; interpolating values (even LIMIT) misses it on every call.
+STATEMENT_CACHE_SIZE = 256
+_MEMORY_DATABASE = ":memory:"
+
+
+async def open_connection(database_path: str) -> aiosqlite.Connection:
+    """Open a tuned aiosqlite connection with row access by column name.
+
+    Args:
+        database_path: Path to the SQLite database file.
+
+    Returns:
+        Open aiosqlite connection.
+    """
+    connection = await aiosqlite.connect(database_path, cached_statements=STATEMENT_CACHE_SIZE)
+    connection.row_factory = aiosqlite.Row
+    await apply_connection_pragmas(connection)
+    return connection
+
+
+class SQLiteConnectionPool:
+    """One writer connection plus a rotating set of read-only connections.
+
+    Without reader connections every read falls back to the writer, which
+    keeps the pool usable for in-memory databases and injected connections.
+    Code sharing the pool holds ``write_lock`` around each write transaction,
+    so transactions from different coroutines never interleave on the writer.
+    """
+
+    def __init__(
+        self,
+        *,
+        writer: aiosqlite.Connection,
+        readers: Sequence[aiosqlite.Connection] = (),
+    ) -> None:
+        """Initialize the pool from already opened connections.
+
+        Args:
+            writer: Connection used for all writes.
+            readers: Connections used for reads.
+        """
+        self._writer = writer
+        self._write_lock = asyncio.Lock()
+        self._readers = tuple(readers)
+        self._idle_readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        for reader in self._readers:
+            self._idle_readers.put_nowait(reader)
+
+    @classmethod
+    async def open(
+        cls,
+        database_path: str,
+        *,
+        reader_count: int = DEFAULT_READER_COUNT,
+    ) -> "SQLiteConnectionPool":
+        """Open a writer and ``reader_count`` reader connections.
+
+        Args:
+            database_path: Path to the SQLite database file.
+            reader_count: Number of read-only connections to open.
+
+        Returns:
+            Pool with all connections opened and tuned.
+        """
+        writer = await open_connection(database_path)
+        if database_path == _MEMORY_DATABASE:
+            # Every connection to ":memory:" is a separate database.
+            reader_count = 0
+
+        readers = []
+        for _ in range(reader_count):
+            reader = await open_connection(database_path)
+            await reader.execute("PRAGMA query_only=ON")
+            readers.append(reader)
+
+        logger.info("Opened SQLite pool with %d reader connection(s)", reader_count)
+        return cls(writer=writer, readers=readers)
+
+    @property
+    def writer(self) -> aiosqlite.Connection:
+        """Connection used for writes.
+
+        Returns:
+            The writer connection.
+        """
+        return self._writer
+
+    @property
+    def write_lock(self) -> asyncio.Lock:
+        """Lock serializing write transactions on the writer connection.
+
+        Returns:
+            The pool's write lock.
+        """
+        return self._write_lock
+
+    @asynccontextmanager
+    async def acquire_reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read connection for the duration of the block.
+
+        Yields:
+            A reader connection, or the writer if the pool has no readers.
+        """
+        if not self._readers:
+            yield self._writer
+            return
+
+        reader = await self._idle_readers.get()
+        try:
+            yield reader
+        finally:
+            self._idle_readers.put_nowait(reader)
+
+    async def close(self) -> None:
+        """Close the writer and all reader connections."""
+        for reader in self._readers:
+            await reader.close()
+        await self._writer.close()
@@ -0,0 +1,28 @@
+"""SQLite connection tuning applied when a connection is opened."""
+
+import aiosqlite
+
+CONNECTION_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+async def apply_connection_pragmas(connection: aiosqlite.Connection) -> None:
+    """Apply performance pragmas to a freshly opened connection.
+
+    WAL lets readers proceed while a write is in progress and, together with
+    ``synchronous=NORMAL``, avoids an fsync on every commit. ``journal_mode``
+    persists in the database file; the remaining pragmas are per-connection.
+    ``busy_timeout`` makes a connection wait for a competing writer instead
+    of failing immediately with "database is locked".
+
+    Args:
+        connection: Open aiosqlite connection to tune.
+    """
+    for pragma in CONNECTION_PRAGMAS:
+        await connection.execute(pragma)
@@ -3,13 +3,22 @@
 import logging
 import os
 
+_CONFIGURED = False
+
 
 def configure_logging(level: str | None = None) -> None:
     """Configure application logging.
 
+    Calls after the first one return immediately unless they pass a level.
+
     Args:
         level: Optional log level override.
     """
+    global _CONFIGURED  # pylint: disable=global-statement
+    if _CONFIGURED and not level:
+        return
+
+    _CONFIGURED = True
     root_logger = logging.getLogger()
     if root_logger.handlers:
         if level:
@@ -1,23 +1,75 @@
 """Shared helpers for SQLite repositories using aiosqlite."""
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
 from typing import Any
 
 import aiosqlite
 
 from src.domain.errors.exceptions import RepositoryError, StorageError
+from src.infrastructure.database.pool import SQLiteConnectionPool
+
+# Rows per multi-row INSERT, keeping bound parameters well under SQLite's limit.
+MAX_ROWS_PER_INSERT = 400
+
+
+def to_db_timestamp(value: datetime) -> str:
+    """Format a datetime the way every timestamp column stores it.
+
+    Timestamps are stored as naive UTC text with fixed-width microseconds, so
+    string comparison in SQL (ORDER BY, row-value seeks) is chronological.
+
+    Args:
+        value: Datetime to store; naive values are taken to be UTC already.
+
+    Returns:
+        Text of the form "YYYY-MM-DD HH:MM:SS.ffffff".
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value.isoformat(sep=" ", timespec="microseconds")
+
+
+def from_db_timestamp(value: str) -> datetime:
+    """Parse a stored timestamp into an aware UTC datetime.
+
+    Args:
+        value: Text read from a timestamp column.
+
+    Returns:
+        Aware datetime; values without an offset are read as UTC.
+    """
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
 
 
 class SQLiteRepositoryBase:
-    """Base class to centralize async sqlite execution + error mapping."""
+    """Base class to centralize async sqlite execution + error mapping.
 
-    def __init__(self, connection: aiosqlite.Connection) -> None:
+    Writes go through the pool's writer connection under the pool's write
+    lock, so one repository's commit or rollback never covers another
+    coroutine's statements; reads borrow a reader connection so they are not
+    queued behind pending writes.
+    """
+
+    def __init__(self, connection: aiosqlite.Connection | SQLiteConnectionPool) -> None:
         """Initialize SQLite repository base.
 
         Args:
-            connection: aiosqlite database connection.
+            connection: Connection pool, or a single aiosqlite connection
+                used for both reads and writes. A bare connection gets a pool,
+                and so a write lock, of its own; repositories sharing a writer
+                should share a pool.
         """
-        self._connection = connection
+        if isinstance(connection, SQLiteConnectionPool):
+            self._pool = connection
+        else:
+            self._pool = SQLiteConnectionPool(writer=connection)
+        self._connection = self._pool.writer
+        self._write_lock = self._pool.write_lock
+        # Writer methods bound once, as the write helpers call them per statement.
+        self._execute_raw = self._connection.execute
+        self._commit = self._connection.commit
 
     async def _execute(
         self,
@@ -39,13 +91,36 @@ class SQLiteRepositoryBase:
         Raises:
             StorageError: If the SQLite operation fails.
         """
-        try:
-            cursor = await self._connection.execute(sql, params)
-            if commit:
-                await self._connection.commit()
-            return cursor
-        except aiosqlite.Error as e:
-            raise StorageError(f"SQLite operation failed: {e}") from e
+        async with self._write_lock:
+            try:
+                cursor = await self._execute_raw(sql, params)
+                if commit:
+                    await self._commit()
+                return cursor
+            except aiosqlite.Error as e:
+                raise StorageError(f"SQLite operation failed: {e}") from e
+
+    async def _execute_returning_one(self, sql: str, params: Sequence[Any] = ()) -> Any | None:
+        """Execute a write with a RETURNING clause, commit, and fetch its row.
+
+        Args:
+            sql: INSERT/UPDATE statement ending in a RETURNING clause.
+            params: Parameters for the SQL statement.
+
+        Returns:
+            The returned row, or None if the statement produced none.
+
+        Raises:
+            StorageError: If the SQLite operation fails.
+        """
+        async with self._write_lock:
+            try:
+                cursor = await self._execute_raw(sql, params)
+                row = await cursor.fetchone()
+                await self._commit()
+                return row
+            except aiosqlite.Error as e:
+                raise StorageError(f"SQLite operation failed: {e}") from e
 
     async def _fetchone(self, sql: str, params: Sequence[Any] = ()) -> Any | None:
         """Execute a SQL query and fetch a single row.
@@ -56,11 +131,18 @@ class SQLiteRepositoryBase:
 
         Returns:
             A single row tuple if found, None otherwise.
-        """
-        cursor = await self._execute(sql, params, commit=False)
-        return await cursor.fetchone()
 
-    async def _fetchall(self, sql: str, params: Sequence[Any] = ()) -> list[Any]:
+        Raises:
+            StorageError: If the SQLite query fails.
+        """
+        async with self._pool.acquire_reader() as reader:
+            try:
+                cursor = await reader.execute(sql, params)
+                return await cursor.fetchone()
+            except aiosqlite.Error as e:
+                raise StorageError(f"SQLite query failed: {e}") from e
+
+    async def _fetchall(self, sql: str, params: Sequence[Any] = ()) -> Iterable[Any]:
         """Execute a SQL query and fetch all rows.
 
         Args:
@@ -68,10 +150,17 @@ class SQLiteRepositoryBase:
             params: Parameters for the SQL query.
 
         Returns:
-            List of row tuples.
+            The rows, as returned by the driver (a fresh list per call).
+
+        Raises:
+            StorageError: If the SQLite query fails.
         """
-        cursor = await self._execute(sql, params, commit=False)
-        return list(await cursor.fetchall())
+        async with self._pool.acquire_reader() as reader:
+            try:
+                cursor = await reader.execute(sql, params)
+                return await cursor.fetchall()
+            except aiosqlite.Error as e:
+                raise StorageError(f"SQLite query failed: {e}") from e
 
     async def _insert_returning_id(
         self,
@@ -95,19 +184,66 @@ class SQLiteRepositoryBase:
                 integrity_error_message is provided.
             StorageError: If the insert operation fails or no ID is returned.
         """
-        try:
-            cursor = await self._connection.execute(sql, params)
-            await self._connection.commit()
-
-            lastrowid = cursor.lastrowid
-            if lastrowid is None:
-                raise StorageError("Failed to get lastrowid after insert")
-            return int(lastrowid)
-
-        except aiosqlite.IntegrityError as e:
-            if integrity_error_message:
-                raise RepositoryError(integrity_error_message) from e
-            raise StorageError(f"SQLite integrity error: {e}") from e
-
-        except aiosqlite.Error as e:
-            raise StorageError(f"SQLite insert failed: {e}") from e
+        async with self._write_lock:
+            try:
+                cursor = await self._execute_raw(sql, params)
+                await self._commit()
+
+                lastrowid = cursor.lastrowid
+                if lastrowid is None:
+                    raise StorageError("Failed to get lastrowid after insert")
+                return int(lastrowid)
+
+            except aiosqlite.IntegrityError as e:
+                if integrity_error_message:
+                    raise RepositoryError(integrity_error_message) from e
+                raise StorageError(f"SQLite integrity error: {e}") from e
+
+            except aiosqlite.Error as e:
+                raise StorageError(f"SQLite insert failed: {e}") from e
+
+    async def _insert_many_returning_ids(
+        self,
+        sql: str,
+        row_placeholder: str,
+        rows: Sequence[Sequence[Any]],
+    ) -> list[int]:
+        """Insert several rows in one transaction and return their IDs.
+
+        Rows are written with multi-row ``INSERT ... RETURNING`` statements of
+        at most ``MAX_ROWS_PER_INSERT`` rows each, followed by a single commit.
+
+        Args:
+            sql: INSERT statement up to and including the VALUES keyword.
+            row_placeholder: Placeholder group for a single row, e.g. "(?, ?)".
+            rows: Parameters for each row to insert.
+
+        Returns:
+            Generated row IDs in insertion order.
+
+        Raises:
+            StorageError: If the insert operation fails or IDs are missing.
+        """
+        if not rows:
+            return []
+
+        returned: list[Any] = []
+        # The lock keeps other writers from committing part of this batch or
+        # having their statements discarded by its rollback.
+        async with self._write_lock:
+            try:
+                for start in range(0, len(rows), MAX_ROWS_PER_INSERT):
+                    chunk = rows[start : start + MAX_ROWS_PER_INSERT]
+                    values = ", ".join([row_placeholder] * len(chunk))
+                    params = [param for row in chunk for param in row]
+                    cursor = await self._execute_raw(f"{sql} {values} RETURNING id", params)
+                    returned.extend(await cursor.fetchall())
+                await self._commit()
+            except aiosqlite.Error as e:
+                await self._connection.rollback()
+                raise StorageError(f"SQLite batch insert failed: {e}") from e
+
+        if len(returned) != len(rows):
+            raise StorageError("Failed to get generated IDs after batch insert")
+        # RETURNING order is unspecified; AUTOINCREMENT IDs follow insertion order.
+        return sorted(int(row[0]) for row in returned)
@@ -4,12 +4,19 @@ This module provides a concrete implementation of the message repository
 interface using SQLite as the storage backend with aiosqlite.
 """
 
-from datetime import datetime
+from collections.abc import Sequence
 
 from src.domain.models.chat_message import ChatMessage
 from src.domain.models.message_role import MessageRole
 from src.domain.repositories.message_repository import IMessageRepository
-from src.infrastructure.repositories.sqlite_base_repository import SQLiteRepositoryBase
+from src.infrastructure.repositories.sqlite_base_repository import (
+    SQLiteRepositoryBase,
+    from_db_timestamp,
+    to_db_timestamp,
+)
+
+# Plain dict lookup; calling MessageRole(value) goes through EnumType.__call__.
+_ROLE_BY_VALUE: dict[str, MessageRole] = {role.value: role for role in MessageRole}
 
 
 class SQLiteMessageRepository(SQLiteRepositoryBase, IMessageRepository):
@@ -32,9 +39,9 @@ class SQLiteMessageRepository(SQLiteRepositoryBase, IMessageRepository):
             (
                 message.user_id,
                 message.provider,
-                message.role.value,
+                message.role,
                 message.content,
-                str(message.timestamp),
+                to_db_timestamp(message.timestamp),
             ),
         )
 
@@ -47,6 +54,42 @@ class SQLiteMessageRepository(SQLiteRepositoryBase, IMessageRepository):
             timestamp=message.timestamp,
         )
 
+    async def save_many(self, messages: Sequence[ChatMessage]) -> list[ChatMessage]:
+        """Save several chat messages with one insert and one commit.
+
+        Args:
+            messages: The chat messages to save, in order.
+
+        Returns:
+            The saved messages with generated IDs, in the same order.
+        """
+        message_ids = await self._insert_many_returning_ids(
+            "INSERT INTO chat_messages (user_id, provider, role, content, timestamp) VALUES",
+            "(?, ?, ?, ?, ?)",
+            [
+                (
+                    message.user_id,
+                    message.provider,
+                    message.role,
+                    message.content,
+                    to_db_timestamp(message.timestamp),
+                )
+                for message in messages
+            ],
+        )
+
+        return [
+            ChatMessage(
+                id=message_id,
+                user_id=message.user_id,
+                provider=message.provider,
+                role=message.role,
+                content=message.content,
+                timestamp=message.timestamp,
+            )
+            for message, message_id in zip(messages, message_ids, strict=True)
+        ]
+
     async def find_by_id(self, message_id: int) -> ChatMessage | None:
         """Find a chat message by its ID.
 
@@ -71,28 +114,69 @@ class SQLiteMessageRepository(SQLiteRepositoryBase, IMessageRepository):
         limit: int = 100,
         offset: int = 0,
     ) -> list[ChatMessage]:
-        """Find all messages for a user.
+        """Find the most recent messages for a user.
 
         Args:
             user_id: The user ID to search for.
             limit: Maximum number of messages to return.
-            offset: Number of messages to skip.
+            offset: Number of newest messages to skip.
 
         Returns:
-            List of messages for the user, ordered by timestamp descending.
+            List of messages for the user, ordered by timestamp ascending
+            (oldest to newest).
         """
         rows = await self._fetchall(
             """
             SELECT id, user_id, provider, role, content, timestamp
-            FROM chat_messages
-            WHERE user_id = ?
-            ORDER BY timestamp DESC
-            LIMIT ? OFFSET ?
+            FROM (
+                SELECT id, user_id, provider, role, content, timestamp
+                FROM chat_messages
+                WHERE user_id = ?
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ? OFFSET ?
+            )
+            ORDER BY timestamp ASC, id ASC
             """,
             (user_id, limit, offset),
         )
         return [self._row_to_message(r) for r in rows]
 
+    async def find_by_user_id_before(
+        self,
+        user_id: int,
+        before: ChatMessage,
+        limit: int = 100,
+    ) -> list[ChatMessage]:
+        """Find the messages for a user that precede a given message.
+
+        Seeks into the (user_id, timestamp) index at ``before`` instead of
+        skipping rows with OFFSET; ``id`` breaks timestamp ties.
+
+        Args:
+            user_id: The user ID to search for.
+            before: Message to page back from (exclusive).
+            limit: Maximum number of messages to return.
+
+        Returns:
+            Up to ``limit`` messages older than ``before``, ordered by
+            timestamp ascending (oldest to newest).
+        """
+        rows = await self._fetchall(
+            """
+            SELECT id, user_id, provider, role, content, timestamp
+            FROM (
+                SELECT id, user_id, provider, role, content, timestamp
+                FROM chat_messages
+                WHERE user_id = ? AND (timestamp, id) < (?, ?)
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ?
+            )
+            ORDER BY timestamp ASC, id ASC
+            """,
+            (user_id, to_db_timestamp(before.timestamp), before.id, limit),
+        )
+        return [self._row_to_message(r) for r in rows]
+
     async def delete_by_user_id(self, user_id: int) -> int:
         """Delete all messages for a user.
 
@@ -139,7 +223,7 @@ class SQLiteMessageRepository(SQLiteRepositoryBase, IMessageRepository):
             id=row[0],
             user_id=row[1],
             provider=row[2],
-            role=MessageRole(row[3]),
+            role=_ROLE_BY_VALUE[row[3]],
             content=row[4],
-            timestamp=datetime.fromisoformat(row[5]),
+            timestamp=from_db_timestamp(row[5]),
         )
@@ -4,15 +4,47 @@ This module provides a concrete implementation of the user repository
 interface using SQLite as the storage backend with aiosqlite.
 """
 
-from datetime import datetime
+from collections import OrderedDict
 
+import aiosqlite
+
+from src.domain.errors.exceptions import StorageError
 from src.domain.models.user import User
 from src.domain.repositories.user_repository import IUserRepository
-from src.infrastructure.repositories.sqlite_base_repository import SQLiteRepositoryBase
+from src.infrastructure.database.pool import SQLiteConnectionPool
+from src.infrastructure.repositories.sqlite_base_repository import (
+    SQLiteRepositoryBase,
+    from_db_timestamp,
+    to_db_timestamp,
+)
+
+DEFAULT_USER_CACHE_SIZE = 256
 
 
 class SQLiteUserRepository(SQLiteRepositoryBase, IUserRepository):
-    """SQLite implementation of IUserRepository using aiosqlite."""
+    """SQLite implementation of IUserRepository using aiosqlite.
+
+    Users looked up by name are kept in a small LRU cache, so repeated
+    ``get_or_create`` calls for the same user (e.g. websocket reconnects)
+    do not query the database. Entries are dropped on ``save``/``delete``.
+    """
+
+    def __init__(
+        self,
+        connection: aiosqlite.Connection | SQLiteConnectionPool,
+        *,
+        cache_size: int = DEFAULT_USER_CACHE_SIZE,
+    ) -> None:
+        """Initialize the user repository.
+
+        Args:
+            connection: Connection pool, or a single aiosqlite connection.
+            cache_size: Maximum number of users cached by username; 0
+                disables the cache.
+        """
+        super().__init__(connection)
+        self._cache_size = cache_size
+        self._users_by_name: OrderedDict[str, User] = OrderedDict()
 
     async def save(self, user: User) -> User:
         """Save a user to the database.
@@ -28,9 +60,10 @@ class SQLiteUserRepository(SQLiteRepositoryBase, IUserRepository):
             INSERT INTO users (username, created_at, updated_at)
             VALUES (?, ?, ?)
             """,
-            (user.username.lower(), user.created_at, user.updated_at),
+            (user.username.lower(), to_db_timestamp(user.created_at), to_db_timestamp(user.updated_at)),
             integrity_error_message=f"User already exists: {user.username}",
         )
+        self._users_by_name.pop(user.username.lower(), None)
 
         return User(
             id=user_id,
@@ -63,11 +96,19 @@ class SQLiteUserRepository(SQLiteRepositoryBase, IUserRepository):
         Returns:
             The user if found, None otherwise.
         """
+        key = username.lower()
+        cached = self._users_by_name.get(key)
+        if cached is not None:
+            self._users_by_name.move_to_end(key)
+            return cached
+
         row = await self._fetchone(
             "SELECT id, username, created_at, updated_at FROM users WHERE username = ?",
-            (username.lower(),),
+            (key,),
         )
-        return None if row is None else self._row_to_user(row)
+        if row is None:
+            return None
+        return self._remember(self._row_to_user(row))
 
     async def exists(self, username: str) -> bool:
         """Check if a user exists.
@@ -79,24 +120,45 @@ class SQLiteUserRepository(SQLiteRepositoryBase, IUserRepository):
             True if user exists, False otherwise.
         """
         row = await self._fetchone(
-            "SELECT COUNT(*) FROM users WHERE username = ?",
+            "SELECT 1 FROM users WHERE username = ? LIMIT 1",
             (username.lower(),),
         )
-        return bool(row and row[0] > 0)
+        return row is not None
 
     async def get_or_create(self, username: str) -> User:
         """Get existing user or create new one.
 
+        Existing users are served by a read. A missing user is created with a
+        single upsert that returns the stored row, so two sessions creating
+        the same user concurrently both get it back instead of one failing
+        on the unique constraint.
+
         Args:
             username: The username to get or create.
 
         Returns:
             The existing or newly created user.
+
+        Raises:
+            StorageError: If the upsert returns no row.
         """
         existing = await self.find_by_username(username)
         if existing:
             return existing
-        return await self.save(User.create_new(username=username))
+
+        user = User.create_new(username=username)
+        row = await self._execute_returning_one(
+            """
+            INSERT INTO users (username, created_at, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT (username) DO UPDATE SET username = excluded.username
+            RETURNING id, username, created_at, updated_at
+            """,
+            (user.username.lower(), to_db_timestamp(user.created_at), to_db_timestamp(user.updated_at)),
+        )
+        if row is None:
+            raise StorageError(f"Failed to get or create user: {username}")
+        return self._remember(self._row_to_user(row))
 
     async def delete(self, user_id: int) -> bool:
         """Delete a user.
@@ -112,8 +174,25 @@ class SQLiteUserRepository(SQLiteRepositoryBase, IUserRepository):
             (user_id,),
             commit=True,
         )
+        for key in [key for key, user in self._users_by_name.items() if user.id == user_id]:
+            del self._users_by_name[key]
         return cursor.rowcount > 0
 
+    def _remember(self, user: User) -> User:
+        """Cache a user loaded from the database under its username.
+
+        Args:
+            user: User as stored in the database.
+
+        Returns:
+            The same user.
+        """
+        if self._cache_size > 0:
+            self._users_by_name[user.username] = user
+            if len(self._users_by_name) > self._cache_size:
+                self._users_by_name.popitem(last=False)
+        return user
+
     @staticmethod
     def _row_to_user(row: tuple) -> User:
         """Convert a database row tuple to a User domain object.
@@ -128,6 +207,6 @@ class SQLiteUserRepository(SQLiteRepositoryBase, IUserRepository):
         return User(
             id=row[0],
             username=row[1],
-            created_at=datetime.fromisoformat(row[2]),
-            updated_at=datetime.fromisoformat(row[3]),
+            created_at=from_db_timestamp(row[2]),
+            updated_at=from_db_timestamp(row[3]),
         )
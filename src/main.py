@@ -5,8 +5,9 @@ from logging import getLogger
 import chainlit as cl
 from chainlit.cli import run_chainlit
 
-from src.bootstrap import get_container
+from src.bootstrap import get_container_async
 from src.domain.errors.exceptions import ChatAppError
+from src.infrastructure.adapters.chainlit.streaming import buffered
 from src.infrastructure.container import Container
 
 logger = getLogger(__name__)
@@ -22,7 +23,7 @@ async def on_chat_start() -> None:
     """
     container: Container | None = None
     try:
-        container = get_container()
+        container = await get_container_async()
         cl.user_session.set("container", container)
 
         session_adapter = container.get_session_adapter()
@@ -106,9 +107,11 @@ async def on_message(message: cl.Message) -> None:
         message_adapter = container.get_message_adapter()
 
         response = message_adapter.create_streaming_message()
-        async for chunk in use_case.stream_response(
-            user_id=user_id,
-            user_input=message.content,
+        async for chunk in buffered(
+            use_case.stream_response(
+                user_id=user_id,
+                user_input=message.content,
+            )
         ):
             await response.stream_token(chunk)
 
@@ -2,9 +2,11 @@
 
 # pylint: disable=protected-access
 
+from collections.abc import AsyncGenerator
 from datetime import datetime
 from unittest.mock import MagicMock
 
+import aiosqlite
 import pytest
 from pytest_mock import MockerFixture
 
@@ -13,6 +15,8 @@ from src.domain.models.message_role import MessageRole
 from src.domain.models.user import User
 from src.domain.repositories.message_repository import IMessageRepository
 from src.domain.repositories.user_repository import IUserRepository
+from src.infrastructure.database.migrator import AsyncDatabaseMigrator
+from src.infrastructure.database.pool import open_connection
 
 
 @pytest.fixture(name="_mock_env_vars")
@@ -31,10 +35,12 @@ def _fixture_mock_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("MEM0_BASE_URL", "http://localhost:8080")
 
 
-@pytest.fixture(name="sample_user")
+@pytest.fixture(name="sample_user", scope="session")
 def fixture_sample_user() -> User:
     """Create a sample user for testing.
 
+    User is frozen, so one instance is shared by the whole session.
+
     Returns:
         A User instance with test data.
     """
@@ -46,7 +52,7 @@ def fixture_sample_user() -> User:
     )
 
 
-@pytest.fixture(name="sample_chat_message")
+@pytest.fixture(name="sample_chat_message", scope="session")
 def fixture_sample_chat_message(sample_user: User) -> ChatMessage:
     """Create a sample chat message for testing.
 
@@ -94,7 +100,7 @@ def fixture_mock_message_repository(mocker: MockerFixture) -> IMessageRepository
     return repo
 
 
-@pytest.fixture(name="mock_datetime_now")
+@pytest.fixture(name="mock_datetime_now", scope="session")
 def fixture_mock_datetime_now() -> datetime:
     """Return a fixed datetime for testing.
 
@@ -134,3 +140,19 @@ def fixture_mock_database_connection(mocker: MockerFixture) -> MagicMock:
     conn._cursor = cursor
 
     return conn
+
+
+@pytest.fixture(name="migrated_connection")
+async def fixture_migrated_connection() -> AsyncGenerator[aiosqlite.Connection, None]:
+    """Create a real in-memory database with the application schema.
+
+    Each test gets its own database: repository writes commit, so a shared
+    connection could not be reset with a savepoint rollback.
+
+    Yields:
+        Tuned aiosqlite connection with all migrations applied.
+    """
+    connection = await open_connection(":memory:")
+    await AsyncDatabaseMigrator(connection).migrate()
+    yield connection
+    await connection.close()
@@ -0,0 +1,226 @@
+"""Integration tests for SQLiteMessageRepository against a migrated database."""
+
+import asyncio
+import shutil
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from src.domain.errors.exceptions import StorageError
+from src.domain.models.chat_message import ChatMessage
+from src.domain.models.message_role import MessageRole
+from src.domain.models.user import User
+from src.infrastructure.database.migrator import (
+    DEFAULT_MIGRATIONS_DIR,
+    AsyncDatabaseMigrator,
+)
+from src.infrastructure.database.pool import SQLiteConnectionPool, open_connection
+from src.infrastructure.repositories.sqlite_base_repository import MAX_ROWS_PER_INSERT
+from src.infrastructure.repositories.sqlite_message_repository import (
+    SQLiteMessageRepository,
+)
+from src.infrastructure.repositories.sqlite_user_repository import SQLiteUserRepository
+
+
+@pytest.fixture(name="message_repository")
+async def fixture_message_repository(migrated_connection: aiosqlite.Connection) -> SQLiteMessageRepository:
+    """Create a message repository on a migrated in-memory database.
+
+    Args:
+        migrated_connection: Real in-memory database with the schema applied.
+
+    Returns:
+        Message repository with one user (ID 1) created.
+    """
+    await migrated_connection.execute("INSERT INTO users (username) VALUES ('ada')")
+    await migrated_connection.commit()
+    return SQLiteMessageRepository(migrated_connection)
+
+
+async def _save_messages(repository: SQLiteMessageRepository, count: int) -> list[ChatMessage]:
+    """Save ``count`` messages for user 1, one second apart.
+
+    Args:
+        repository: Repository to save into.
+        count: Number of messages to save.
+
+    Returns:
+        Saved messages, oldest first.
+    """
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    return await repository.save_many(
+        [
+            ChatMessage(
+                id=0,
+                user_id=1,
+                provider="ollama",
+                role=MessageRole.USER,
+                content=f"message {i}",
+                timestamp=start + timedelta(seconds=i),
+            )
+            for i in range(count)
+        ]
+    )
+
+
+@pytest.mark.integration
+async def test_find_by_user_id_before_pages_back_through_history(
+    message_repository: SQLiteMessageRepository,
+) -> None:
+    """Test that seek pagination returns the page preceding a message.
+
+    Args:
+        message_repository: Repository on a migrated in-memory database.
+    """
+    await _save_messages(message_repository, 5)
+
+    latest = await message_repository.find_by_user_id(1, limit=2)
+    previous = await message_repository.find_by_user_id_before(1, latest[0], limit=2)
+    first = await message_repository.find_by_user_id_before(1, previous[0], limit=2)
+
+    assert [m.content for m in latest] == ["message 3", "message 4"]
+    assert [m.content for m in previous] == ["message 1", "message 2"]
+    assert [m.content for m in first] == ["message 0"]
+    assert await message_repository.find_by_user_id_before(1, first[0]) == []
+
+
+@pytest.mark.integration
+async def test_message_round_trip(message_repository: SQLiteMessageRepository) -> None:
+    """Test saving, finding, counting and deleting messages with real SQL.
+
+    Args:
+        message_repository: Repository on a migrated in-memory database.
+    """
+    saved = await _save_messages(message_repository, 3)
+    found = await message_repository.find_by_id(saved[1].id)
+
+    assert found == saved[1]
+    assert await message_repository.find_by_user_id(1) == saved
+    assert await message_repository.find_by_user_id(1, limit=1, offset=1) == [saved[1]]
+    assert await message_repository.count_by_user_id(1) == 3
+
+    assert await message_repository.delete_by_user_id(1) == 3
+    assert await message_repository.count_by_user_id(1) == 0
+    assert await message_repository.find_by_id(saved[0].id) is None
+
+
+@pytest.fixture(name="_server_timezone")
+def _fixture_server_timezone(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Run the test as if the server's local time were UTC-5.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Yields:
+        None while the local timezone is overridden.
+    """
+    monkeypatch.setenv("TZ", "EST5")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("_server_timezone")
+async def test_legacy_local_time_rows_sort_with_new_utc_rows(tmp_path: Path) -> None:
+    """Test that rows written in local time before the UTC switch are normalized.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+    """
+    legacy_dir = tmp_path / "migrations"
+    legacy_dir.mkdir()
+    for name in ("001_initial_schema.sql", "002_add_indexes.sql", "003_add_user_timestamp_index.sql"):
+        shutil.copy(DEFAULT_MIGRATIONS_DIR / name, legacy_dir / name)
+
+    connection = await open_connection(":memory:")
+    try:
+        await AsyncDatabaseMigrator(connection, legacy_dir).migrate()
+        # Written by the old code with datetime.now(): 07:00 local is 12:00 UTC.
+        await connection.executemany(
+            "INSERT INTO users (username, created_at, updated_at) VALUES (?, ?, ?)",
+            [
+                ("ada", "2026-01-01 07:00:00.250000", "2026-01-01 07:00:00"),
+                ("bob", "2026-01-02 07:00:00", "2026-01-02 09:00:00+01:00"),
+                ("cy", "2026-01-03 06:00:00-05:00", "2026-01-03 07:00:00"),
+            ],
+        )
+        await connection.executemany(
+            "INSERT INTO chat_messages (user_id, provider, role, content, timestamp) VALUES (1, 'ollama', 'user', ?, ?)",
+            [("legacy", "2026-01-01 07:00:00.250000"), ("offset", "2026-01-01 06:00:00-05:00")],
+        )
+        await connection.commit()
+        await AsyncDatabaseMigrator(connection).migrate()
+
+        repository = SQLiteMessageRepository(connection)
+        await repository.save(
+            ChatMessage(
+                id=0,
+                user_id=1,
+                provider="ollama",
+                role=MessageRole.ASSISTANT,
+                content="new",
+                timestamp=datetime(2026, 1, 1, 10, 0, tzinfo=UTC),
+            )
+        )
+
+        history = await repository.find_by_user_id(1)
+        older = await repository.find_by_user_id_before(1, history[1])
+        cursor = await connection.execute("SELECT created_at, updated_at FROM users ORDER BY username")
+        user_rows = await cursor.fetchall()
+    finally:
+        await connection.close()
+
+    assert [m.content for m in history] == ["new", "offset", "legacy"]
+    assert history[1].timestamp == datetime(2026, 1, 1, 11, 0, tzinfo=UTC)
+    assert history[2].timestamp == datetime(2026, 1, 1, 12, 0, 0, 250000, tzinfo=UTC)
+    assert history[0].timestamp < history[1].timestamp < history[2].timestamp
+    assert [m.content for m in older] == ["new"]
+    assert [tuple(row) for row in user_rows] == [
+        ("2026-01-01 12:00:00.250000", "2026-01-01 12:00:00.000000"),
+        ("2026-01-02 12:00:00.000000", "2026-01-02 08:00:00.000000"),
+        ("2026-01-03 11:00:00.000000", "2026-01-03 12:00:00.000000"),
+    ]
+
+
+@pytest.mark.integration
+async def test_failed_batch_does_not_roll_back_concurrent_writes(
+    migrated_connection: aiosqlite.Connection,
+) -> None:
+    """Test that a batch rollback on the shared writer spares other writers.
+
+    Args:
+        migrated_connection: Real in-memory database with the schema applied.
+    """
+    pool = SQLiteConnectionPool(writer=migrated_connection)
+    users = SQLiteUserRepository(pool, cache_size=0)
+    messages = SQLiteMessageRepository(pool)
+    owner = await users.save(User.create_new("ada"))
+
+    valid = ChatMessage.create(user_id=owner.id, provider="ollama", role=MessageRole.USER, content="hi")
+    # The second chunk violates NOT NULL on content after the first one ran.
+    broken = ChatMessage(
+        id=0,
+        user_id=owner.id,
+        provider="ollama",
+        role=MessageRole.USER,
+        content=None,  # type: ignore[arg-type]
+        timestamp=valid.timestamp,
+    )
+    batch = [valid] * MAX_ROWS_PER_INSERT + [broken]
+
+    results = await asyncio.gather(
+        messages.save_many(batch),
+        users.save(User.create_new("grace")),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], StorageError)
+    assert isinstance(results[1], User)
+    assert await users.exists("grace")
+    assert await messages.count_by_user_id(owner.id) == 0
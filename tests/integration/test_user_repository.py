@@ -0,0 +1,36 @@
+"""Integration tests for SQLiteUserRepository against a migrated database."""
+
+import aiosqlite
+import pytest
+
+from src.domain.errors.exceptions import RepositoryError
+from src.domain.models.user import User
+from src.infrastructure.repositories.sqlite_user_repository import (
+    SQLiteUserRepository,
+)
+
+
+@pytest.mark.integration
+async def test_user_round_trip(migrated_connection: aiosqlite.Connection) -> None:
+    """Test saving, finding, upserting and deleting users with real SQL.
+
+    Args:
+        migrated_connection: Real in-memory database with the schema applied.
+    """
+    repository = SQLiteUserRepository(migrated_connection, cache_size=0)
+
+    saved = await repository.save(User.create_new("Ada"))
+    found = await repository.find_by_username("ADA")
+    upserted = await repository.get_or_create("grace")
+
+    assert found is not None
+    assert found.id == saved.id
+    assert await repository.exists("ada")
+    assert (await repository.get_or_create("Grace")).id == upserted.id
+
+    with pytest.raises(RepositoryError, match="User already exists"):
+        await repository.save(User.create_new("ada"))
+
+    assert await repository.delete(saved.id)
+    assert not await repository.exists("ada")
+    assert await repository.find_by_id(saved.id) is None
@@ -0,0 +1,260 @@
+"""Unit tests for the send message use case."""
+
+# pylint: disable=protected-access
+
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.get_system_prompt import GetSystemPromptUseCase
+from src.application.use_cases.load_history import LoadHistoryUseCase
+from src.application.use_cases.send_message import SendMessageUseCase
+from src.config.prompts import PromptConfig
+from src.domain.errors.exceptions import ProviderError, StorageError
+from src.domain.interfaces.provider import Provider
+from src.domain.models.chat_message import ChatMessage
+from src.domain.models.message_role import MessageRole
+from src.domain.models.provider_message import ProviderMessage
+from src.domain.repositories.message_repository import IMessageRepository
+
+
+class FakeProvider(Provider):
+    """Provider stub that streams a fixed list of tokens."""
+
+    def __init__(self, tokens: list[str], *, error: Exception | None = None) -> None:
+        """Initialize the fake provider.
+
+        Args:
+            tokens: Tokens to stream.
+            error: Optional exception raised after streaming the tokens.
+        """
+        self.tokens = tokens
+        self.error = error
+        self.received: list[ProviderMessage] = []
+
+    async def _stream(self, messages: list[ProviderMessage]) -> AsyncIterator[str]:
+        self.received = list(messages)
+        for token in self.tokens:
+            yield token
+        if self.error is not None:
+            raise self.error
+
+    def stream_response(
+        self,
+        messages: list[ProviderMessage],
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream the configured tokens.
+
+        Args:
+            messages: Conversation context.
+            system_prompt: Unused system prompt.
+
+        Returns:
+            Async iterator over the configured tokens.
+        """
+        return self._stream(messages)
+
+    async def complete(
+        self,
+        messages: list[ProviderMessage],
+        system_prompt: str | None = None,
+    ) -> str:
+        """Return the configured tokens joined.
+
+        Args:
+            messages: Conversation context.
+            system_prompt: Unused system prompt.
+
+        Returns:
+            The joined tokens.
+        """
+        return "".join(self.tokens)
+
+    @property
+    def name(self) -> str:
+        """Provider name identifier.
+
+        Returns:
+            The provider name.
+        """
+        return "fake"
+
+    @property
+    def model(self) -> str:
+        """Model identifier.
+
+        Returns:
+            The model name.
+        """
+        return "fake-model"
+
+
+def _build_use_case(
+    message_repository: IMessageRepository,
+    provider: Provider,
+) -> SendMessageUseCase:
+    return SendMessageUseCase(
+        message_repository=message_repository,
+        provider=provider,
+        load_history_use_case=LoadHistoryUseCase(message_repository=message_repository),
+        get_system_prompt_use_case=GetSystemPromptUseCase(prompt_config=PromptConfig.default()),
+    )
+
+
+class TestSendMessageUseCase:
+    """Test suite for SendMessageUseCase."""
+
+    @pytest.mark.unit
+    async def test_stream_response_yields_tokens_and_persists_messages(
+        self,
+        mock_message_repository: AsyncMock,
+        sample_chat_message: ChatMessage,
+    ) -> None:
+        """Test that tokens are streamed and both messages are saved in one batch.
+
+        Args:
+            mock_message_repository: Mocked message repository.
+            sample_chat_message: Previously stored chat message.
+        """
+        mock_message_repository.find_by_user_id.return_value = [sample_chat_message]
+        provider = FakeProvider(["Hel", "lo"])
+        use_case = _build_use_case(mock_message_repository, provider)
+
+        tokens = [token async for token in use_case.stream_response(user_id=1, user_input="Hi")]
+
+        assert tokens == ["Hel", "lo"]
+        assert provider.received[0].role == MessageRole.SYSTEM
+        assert provider.received[1].content == sample_chat_message.content
+        assert provider.received[-1] == ProviderMessage(role=MessageRole.USER, content="Hi")
+
+        mock_message_repository.save.assert_not_awaited()
+        saved = mock_message_repository.save_many.await_args.args[0]
+        assert [(m.role, m.content) for m in saved] == [
+            (MessageRole.USER, "Hi"),
+            (MessageRole.ASSISTANT, "Hello"),
+        ]
+
+    @pytest.mark.unit
+    async def test_stream_response_persists_user_message_on_provider_error(
+        self,
+        mock_message_repository: AsyncMock,
+    ) -> None:
+        """Test that transport failures are wrapped and the user input is kept.
+
+        Args:
+            mock_message_repository: Mocked message repository.
+        """
+        mock_message_repository.find_by_user_id.return_value = []
+        provider = FakeProvider(["partial"], error=ConnectionResetError("connection reset"))
+        use_case = _build_use_case(mock_message_repository, provider)
+
+        with pytest.raises(ProviderError, match="connection reset"):
+            async for _ in use_case.stream_response(user_id=1, user_input="Hi"):
+                pass
+
+        mock_message_repository.save.assert_awaited_once()
+        mock_message_repository.save_many.assert_not_awaited()
+        assert mock_message_repository.save.await_args.args[0].role == MessageRole.USER
+
+    @pytest.mark.unit
+    async def test_stream_response_does_not_wrap_unexpected_errors(
+        self,
+        mock_message_repository: AsyncMock,
+    ) -> None:
+        """Test that non-transport errors propagate unchanged.
+
+        Args:
+            mock_message_repository: Mocked message repository.
+        """
+        mock_message_repository.find_by_user_id.return_value = []
+        provider = FakeProvider([], error=ValueError("bad payload"))
+        use_case = _build_use_case(mock_message_repository, provider)
+
+        with pytest.raises(ValueError, match="bad payload"):
+            async for _ in use_case.stream_response(user_id=1, user_input="Hi"):
+                pass
+
+        mock_message_repository.save.assert_awaited_once()
+
+    @pytest.mark.unit
+    async def test_stream_response_persists_user_message_on_history_error(
+        self,
+        mock_message_repository: AsyncMock,
+    ) -> None:
+        """Test that the user input is kept when loading history fails.
+
+        Args:
+            mock_message_repository: Mocked message repository.
+        """
+        mock_message_repository.find_by_user_id.side_effect = StorageError("database is locked")
+        use_case = _build_use_case(mock_message_repository, FakeProvider(["unused"]))
+
+        with pytest.raises(StorageError, match="database is locked"):
+            async for _ in use_case.stream_response(user_id=1, user_input="Hi"):
+                pass
+
+        mock_message_repository.save.assert_awaited_once()
+        mock_message_repository.save_many.assert_not_awaited()
+        saved = mock_message_repository.save.await_args.args[0]
+        assert (saved.role, saved.content) == (MessageRole.USER, "Hi")
+
+    @pytest.mark.unit
+    async def test_stream_response_keeps_stream_error_when_save_fails(
+        self,
+        mock_message_repository: AsyncMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that a failed user-message save does not mask the stream error.
+
+        Args:
+            mock_message_repository: Mocked message repository.
+            caplog: Pytest log capture fixture.
+        """
+        mock_message_repository.find_by_user_id.return_value = []
+        mock_message_repository.save.side_effect = StorageError("disk I/O error")
+        provider = FakeProvider(["partial"], error=ProviderError("model crashed"))
+        use_case = _build_use_case(mock_message_repository, provider)
+
+        with pytest.raises(ProviderError, match="model crashed"):
+            async for _ in use_case.stream_response(user_id=1, user_input="Hi"):
+                pass
+
+        mock_message_repository.save.assert_awaited_once()
+        assert "Failed to save user message" in caplog.text
+        assert "disk I/O error" in caplog.text
+
+    @pytest.mark.unit
+    async def test_stream_response_cancels_history_load_on_prompt_error(
+        self,
+        mock_message_repository: AsyncMock,
+    ) -> None:
+        """Test that a failing prompt lookup cancels the pending history load.
+
+        Args:
+            mock_message_repository: Mocked message repository.
+        """
+        history_started = asyncio.Event()
+
+        async def slow_history(*_args: object, **_kwargs: object) -> list[ChatMessage]:
+            history_started.set()
+            await asyncio.sleep(10)
+            return []
+
+        async def failing_prompt(*, variant: str | None = None) -> ProviderMessage:
+            await history_started.wait()
+            raise LookupError(variant)
+
+        mock_message_repository.find_by_user_id.side_effect = slow_history
+        use_case = _build_use_case(mock_message_repository, FakeProvider(["unused"]))
+        use_case._get_system_prompt_use_case.execute_message = failing_prompt  # type: ignore[method-assign]
+
+        with pytest.raises(LookupError):
+            async for _ in use_case.stream_response(user_id=1, user_input="Hi"):
+                pass
+
+        await asyncio.sleep(0)
+        assert not [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        mock_message_repository.save.assert_awaited_once()
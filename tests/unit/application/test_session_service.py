@@ -0,0 +1,27 @@
+"""Unit tests for the session service."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.services.session_service import SessionService
+from src.domain.models.user import User
+from src.domain.repositories.user_repository import IUserRepository
+
+
+class TestSessionService:
+    """Test suite for SessionService."""
+
+    @pytest.mark.unit
+    async def test_get_or_create_user_accepts_username_keyword(self) -> None:
+        """Test that the bound repository method is callable by keyword."""
+        user = User(id=1, username="grace", created_at=datetime.now(UTC), updated_at=datetime.now(UTC))
+        repository = AsyncMock(spec=IUserRepository)
+        repository.get_or_create.return_value = user
+        service = SessionService(user_repository=repository)
+
+        result = await service.get_or_create_user(username="grace")
+
+        assert result is user
+        repository.get_or_create.assert_awaited_once_with(username="grace")
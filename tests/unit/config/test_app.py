@@ -0,0 +1,47 @@
+"""Unit tests for application configuration."""
+
+import pytest
+
+from src.config.app import AppConfig, get_config
+
+
+class TestAppConfig:
+    """Test suite for AppConfig and get_config."""
+
+    @pytest.mark.unit
+    @pytest.mark.usefixtures("_mock_env_vars")
+    def test_get_config_returns_cached_instance(self) -> None:
+        """Test that get_config loads the configuration only once."""
+        get_config.cache_clear()
+        try:
+            config = get_config()
+
+            assert get_config() is config
+            assert config.database_path == ":memory:"
+        finally:
+            get_config.cache_clear()
+
+    @pytest.mark.unit
+    def test_sub_configs_are_built_once(self) -> None:
+        """Test that sub-configuration views are cached per instance."""
+        config = AppConfig(database_path="test.db", ollama_model="mistral")
+
+        first = config.provider_config
+        assert config.provider_config is first
+        assert config.provider_config.ollama_model == "mistral"
+        assert config.database_config.path == "test.db"
+
+    @pytest.mark.unit
+    def test_sub_configs_do_not_reread_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that sub-configuration views only reflect the root config values.
+
+        Args:
+            monkeypatch: Pytest monkeypatch fixture.
+        """
+        config = AppConfig(mem0_enabled=True, agenta_base_url="http://agenta.local")
+        monkeypatch.setenv("BASE_URL", "http://from-env.local")
+        monkeypatch.setenv("ENABLED", "false")
+
+        assert config.mem0_config.enabled is True
+        assert config.mem0_config.base_url == "http://localhost:8080"
+        assert config.agenta_config.base_url == "http://agenta.local"
@@ -0,0 +1,29 @@
+"""Unit tests for prompt configuration."""
+
+import pytest
+
+from src.config.prompts import PromptConfig
+from src.domain.models.message_role import MessageRole
+
+
+class TestPromptConfig:
+    """Test suite for PromptConfig."""
+
+    @pytest.mark.unit
+    def test_system_provider_message_is_shared(self) -> None:
+        """Test that each variant resolves to one prebuilt system message."""
+        config = PromptConfig(system_prompt="default", variants={"short": "Be brief."})
+
+        message = config.resolve_system_provider_message("short")
+
+        assert message is config.resolve_system_provider_message("short")
+        assert message.role == MessageRole.SYSTEM
+        assert message.content == "Be brief."
+
+    @pytest.mark.unit
+    def test_unknown_variant_falls_back_to_default_message(self) -> None:
+        """Test that unknown variants resolve to the default system message."""
+        config = PromptConfig(system_prompt="default", variants={})
+
+        assert config.resolve_system_provider_message("missing") is config.resolve_system_provider_message()
+        assert config.resolve_system_provider_message("missing").content == "default"
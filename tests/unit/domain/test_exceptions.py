@@ -11,6 +11,14 @@ from src.domain.errors.exceptions import (
     ValidationError,
 )
 
+DOMAIN_ERRORS: list[type[ChatAppError]] = [
+    ValidationError,
+    StorageError,
+    ConfigurationError,
+    RepositoryError,
+    ProviderError,
+]
+
 
 class TestChatAppError:
     """Test suite for base ChatAppError."""
@@ -30,126 +38,50 @@ class TestChatAppError:
         assert isinstance(error, Exception)
 
 
-class TestValidationError:
-    """Test suite for ValidationError."""
-
-    @pytest.mark.unit
-    def test_validation_error_creation(self) -> None:
-        """Test validation error creation."""
-        error = ValidationError("Invalid input")
-
-        assert str(error) == "Invalid input"
-        assert isinstance(error, ChatAppError)
+class TestDomainErrors:
+    """Test suite shared by every ChatAppError subclass."""
 
     @pytest.mark.unit
-    def test_validation_error_raises_correctly(self) -> None:
-        """Test that ValidationError can be raised and caught."""
-        with pytest.raises(ValidationError) as exc_info:
-            raise ValidationError("Field is required")
+    @pytest.mark.parametrize("error_class", DOMAIN_ERRORS)
+    def test_error_creation(self, error_class: type[ChatAppError]) -> None:
+        """Test that the error keeps its message and is a ChatAppError.
 
-        assert str(exc_info.value) == "Field is required"
+        Args:
+            error_class: Domain error class under test.
+        """
+        error = error_class("Something went wrong")
 
-
-class TestStorageError:
-    """Test suite for StorageError."""
-
-    @pytest.mark.unit
-    def test_storage_error_creation(self) -> None:
-        """Test storage error creation."""
-        error = StorageError("Database connection failed")
-
-        assert str(error) == "Database connection failed"
+        assert str(error) == "Something went wrong"
         assert isinstance(error, ChatAppError)
 
-
-class TestConfigurationError:
-    """Test suite for ConfigurationError."""
-
     @pytest.mark.unit
-    def test_configuration_error_creation(self) -> None:
-        """Test configuration error creation."""
-        error = ConfigurationError("Missing API key")
-
-        assert str(error) == "Missing API key"
-        assert isinstance(error, ChatAppError)
-
-
-class TestRepositoryError:
-    """Test suite for RepositoryError."""
-
-    @pytest.mark.unit
-    def test_repository_error_creation(self) -> None:
-        """Test repository error creation."""
-        error = RepositoryError("User not found")
-
-        assert str(error) == "User not found"
-        assert isinstance(error, ChatAppError)
-
-    @pytest.mark.unit
-    def test_repository_error_raises_correctly(self) -> None:
-        """Test that RepositoryError can be raised and caught."""
-        with pytest.raises(RepositoryError) as exc_info:
-            raise RepositoryError("Entity not found")
-
-        assert str(exc_info.value) == "Entity not found"
-
-
-class TestProviderError:
-    """Test suite for ProviderError."""
-
-    @pytest.mark.unit
-    def test_provider_error_creation(self) -> None:
-        """Test provider error creation."""
-        error = ProviderError("API rate limit exceeded")
-
-        assert str(error) == "API rate limit exceeded"
-        assert isinstance(error, ChatAppError)
+    @pytest.mark.parametrize("error_class", [ChatAppError, *DOMAIN_ERRORS])
+    @pytest.mark.parametrize("caught_as", [None, ChatAppError, Exception], ids=["own", "base", "exception"])
+    def test_error_can_be_caught(
+        self,
+        error_class: type[ChatAppError],
+        caught_as: type[Exception] | None,
+    ) -> None:
+        """Test that the error is caught as itself, ChatAppError and Exception.
+
+        Args:
+            error_class: Domain error class under test.
+            caught_as: Class used to catch the error; None means the error's own class.
+        """
+        with pytest.raises(caught_as or error_class, match="Test"):
+            raise error_class("Test")
 
 
 class TestExceptionHierarchy:
     """Test suite for exception hierarchy."""
 
     @pytest.mark.unit
-    def test_all_inherit_from_chat_app_error(self) -> None:
-        """Test that all domain exceptions inherit from ChatAppError."""
-        exceptions = [
-            ValidationError("test"),
-            StorageError("test"),
-            ConfigurationError("test"),
-            RepositoryError("test"),
-            ProviderError("test"),
-        ]
-
-        for exc in exceptions:
-            assert isinstance(exc, ChatAppError)
-
-    @pytest.mark.unit
-    def test_all_can_be_caught_as_chat_app_error(self) -> None:
-        """Test that all exceptions can be caught as ChatAppError."""
-        exceptions_to_test = [
-            ValidationError,
-            StorageError,
-            ConfigurationError,
-            RepositoryError,
-            ProviderError,
-        ]
-
-        for exc_class in exceptions_to_test:
-            with pytest.raises(ChatAppError):
-                raise exc_class("Test")
-
-    @pytest.mark.unit
-    def test_all_can_be_caught_as_exception(self) -> None:
-        """Test that all exceptions can be caught as generic Exception."""
-        exceptions_to_test = [
-            ChatAppError,
-            ValidationError,
-            StorageError,
-            ConfigurationError,
-            RepositoryError,
-            ProviderError,
-        ]
-
-        for exc_class in exceptions_to_test:
-            with pytest.raises(exc_class, match="Test"):
-                raise exc_class("Test")
+    @pytest.mark.parametrize("error_class", DOMAIN_ERRORS)
+    def test_all_inherit_from_chat_app_error(self, error_class: type[ChatAppError]) -> None:
+        """Test that all domain exceptions inherit from ChatAppError.
+
+        Args:
+            error_class: Domain error class under test.
+        """
+        assert issubclass(error_class, ChatAppError)
+        assert issubclass(error_class, Exception)
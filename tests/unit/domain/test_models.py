@@ -1,11 +1,12 @@
 """Unit tests for domain models."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
 
 from src.domain.models.chat_message import ChatMessage
 from src.domain.models.message_role import MessageRole
+from src.domain.models.provider_message import ProviderMessage
 from src.domain.models.user import User
 
 
@@ -41,6 +42,20 @@ class TestUser:
         assert user.normalized_username == "newuser"
         assert isinstance(user.created_at, datetime)
         assert isinstance(user.updated_at, datetime)
+        assert user.created_at.tzinfo is UTC
+
+    @pytest.mark.unit
+    def test_user_update_timestamp(self) -> None:
+        """Test that update_timestamp returns a copy with only updated_at changed."""
+        then = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+        user = User(id=7, username="user", created_at=then, updated_at=then)
+
+        updated = user.update_timestamp()
+
+        assert updated is not user
+        assert (updated.id, updated.username, updated.created_at) == (7, "user", then)
+        assert updated.updated_at > then
+        assert user.updated_at == then
 
     @pytest.mark.unit
     def test_user_normalization(self) -> None:
@@ -112,6 +127,7 @@ class TestChatMessage:
         assert message.content == "User message"
         assert message.provider == "openrouter"
         assert message.id == 0
+        assert message.timestamp.tzinfo is UTC
 
     @pytest.mark.unit
     def test_message_role_properties(self) -> None:
@@ -155,6 +171,18 @@ class TestChatMessage:
         assert "timestamp" in data
 
 
+class TestProviderMessage:
+    """Test suite for ProviderMessage model."""
+
+    @pytest.mark.unit
+    def test_to_dict_uses_role_value(self) -> None:
+        """Test that to_dict emits the plain role string for every role."""
+        for role in MessageRole:
+            message = ProviderMessage(role=role, content="Test")
+
+            assert message.to_dict() == {"role": role.value, "content": "Test"}
+
+
 class TestMessageRole:
     """Test suite for MessageRole enum."""
 
@@ -164,6 +192,13 @@ class TestMessageRole:
         assert MessageRole.USER.value == "user"
         assert MessageRole.ASSISTANT.value == "assistant"
 
+    @pytest.mark.unit
+    def test_role_is_plain_string(self) -> None:
+        """Test that roles compare equal to and format as their string values."""
+        assert MessageRole.USER == "user"
+        assert f"{MessageRole.SYSTEM}" == "system"
+        assert MessageRole("assistant") is MessageRole.ASSISTANT
+
     @pytest.mark.unit
     def test_role_comparison(self) -> None:
         """Test role comparison."""
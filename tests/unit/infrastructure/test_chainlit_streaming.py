@@ -0,0 +1,115 @@
+"""Unit tests for read-ahead stream buffering."""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+
+import pytest
+
+from src.infrastructure.adapters.chainlit.streaming import buffered
+
+
+async def _count(limit: int, produced: list[int]) -> AsyncIterator[int]:
+    for number in range(limit):
+        produced.append(number)
+        yield number
+
+
+class TestBuffered:
+    """Test suite for the buffered stream helper."""
+
+    @pytest.mark.unit
+    async def test_yields_items_in_order(self) -> None:
+        """Test that every item arrives in source order."""
+        items = [item async for item in buffered(_count(100, []), size=4)]
+
+        assert items == list(range(100))
+
+    @pytest.mark.unit
+    async def test_reads_ahead_while_consumer_waits(self) -> None:
+        """Test that the source is read ahead up to the buffer size."""
+        produced: list[int] = []
+        stream = buffered(_count(100, produced), size=4)
+        assert isinstance(stream, AsyncGenerator)
+
+        assert await anext(stream) == 0
+        await asyncio.sleep(0.01)
+
+        # One item consumed, four queued, one waiting for a free slot.
+        assert len(produced) == 6
+        await stream.aclose()
+
+    @pytest.mark.unit
+    async def test_reraises_source_error_after_items(self) -> None:
+        """Test that source errors surface after the items produced before them."""
+
+        async def failing() -> AsyncIterator[str]:
+            yield "partial"
+            raise ConnectionResetError("connection reset")
+
+        items: list[str] = []
+        with pytest.raises(ConnectionResetError, match="connection reset"):
+            async for item in buffered(failing()):
+                items.append(item)
+
+        assert items == ["partial"]
+
+    @pytest.mark.unit
+    async def test_reraises_base_exception_from_source(self) -> None:
+        """Test that a non-Exception error from the source does not hang the consumer."""
+
+        class Abort(BaseException):
+            """BaseException raised by the source."""
+
+        async def aborting() -> AsyncIterator[str]:
+            yield "partial"
+            raise Abort
+
+        async def consume() -> list[str]:
+            return [item async for item in buffered(aborting())]
+
+        with pytest.raises(Abort):
+            await asyncio.wait_for(consume(), timeout=1)
+
+    @pytest.mark.unit
+    async def test_source_cleanup_finishes_before_close_returns(self) -> None:
+        """Test that stopping early waits for the cancelled producer's teardown."""
+        cleaned_up = False
+
+        async def endless() -> AsyncIterator[int]:
+            nonlocal cleaned_up
+            try:
+                number = 0
+                while True:
+                    yield number
+                    number += 1
+            finally:
+                await asyncio.sleep(0)
+                cleaned_up = True
+
+        stream = buffered(endless(), size=2)
+        assert isinstance(stream, AsyncGenerator)
+        assert await anext(stream) == 0
+
+        await stream.aclose()
+
+        assert cleaned_up
+
+    @pytest.mark.unit
+    async def test_never_suspending_source_does_not_starve_other_tasks(self) -> None:
+        """Test that other tasks get a turn at least once per buffer's worth of items."""
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        try:
+            async for _ in buffered(_count(320, []), size=32):
+                pass
+        finally:
+            task.cancel()
+
+        assert ticks >= 320 // 32
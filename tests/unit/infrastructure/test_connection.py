@@ -0,0 +1,206 @@
+"""Unit tests for module-level database connection management."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from unittest.mock import patch
+
+import aiosqlite
+import pytest
+
+from src.config.app import AppConfig
+from src.domain.errors.exceptions import StorageError
+from src.infrastructure.database.connection import (
+    DatabaseConnection,
+    close_connection,
+    get_connection,
+    init_database,
+)
+from src.infrastructure.database.initializer import initialize_database
+from src.infrastructure.database.migrator import AsyncDatabaseMigrator
+from src.infrastructure.database.pool import open_connection
+
+
+@pytest.fixture(name="_close_connections")
+async def fixture_close_connections() -> AsyncGenerator[None, None]:
+    """Close module-level connections after the test.
+
+    Yields:
+        Nothing.
+    """
+    yield
+    await close_connection()
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("_close_connections")
+async def test_connections_are_shared_per_database_path(tmp_path: Path) -> None:
+    """Test that each database path gets one connection, reused on later calls.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+    """
+    first_config = AppConfig(database_path=str(tmp_path / "first.db"))
+    second_config = AppConfig(database_path=str(tmp_path / "second.db"))
+
+    first = await init_database(first_config)
+
+    assert await get_connection(first_config) is first
+    assert await init_database(AppConfig(database_path=first_config.database_path)) is first
+    assert await init_database(second_config) is not first
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("_close_connections")
+async def test_init_database_applies_connection_pragmas(tmp_path: Path) -> None:
+    """Test that module-level connections are opened in WAL mode.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+    """
+    connection = await init_database(AppConfig(database_path=str(tmp_path / "wal.db")))
+
+    cursor = await connection.execute("PRAGMA journal_mode")
+    row = await cursor.fetchone()
+
+    assert row is not None
+    assert row[0] == "wal"
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("_close_connections")
+@pytest.mark.parametrize("error", [StorageError("Migration failed: boom"), RuntimeError("boom")])
+async def test_init_database_closes_connection_when_migration_fails(tmp_path: Path, error: Exception) -> None:
+    """Test that a failed migration closes the connection and caches nothing.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+        error: Exception raised by the migrator.
+    """
+    config = AppConfig(database_path=str(tmp_path / "broken.db"))
+    opened: list[aiosqlite.Connection] = []
+
+    async def tracking_open(database_path: str) -> aiosqlite.Connection:
+        connection = await open_connection(database_path)
+        opened.append(connection)
+        return connection
+
+    with (
+        patch("src.infrastructure.database.connection.open_connection", tracking_open),
+        patch.object(AsyncDatabaseMigrator, "migrate", autospec=True, side_effect=error),
+        pytest.raises(type(error), match="boom"),
+    ):
+        await init_database(config)
+
+    assert len(opened) == 1
+    with pytest.raises(ValueError, match="no active connection"):
+        await opened[0].execute("SELECT 1")
+    assert await init_database(config) is not opened[0]
+
+
+@pytest.mark.unit
+async def test_database_connection_fetch_helpers(tmp_path: Path) -> None:
+    """Test that inserted rows are returned by the fetch helpers return by column name.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+    """
+    database = DatabaseConnection(AppConfig(database_path=str(tmp_path / "fetch.db")))
+    await database.init()
+    try:
+        await database.execute("INSERT INTO users (username) VALUES (?)", ("ada",), commit=True)
+        await database.execute_many("INSERT INTO users (username) VALUES (?)", [("bob",), ("cy",)])
+
+        rows = await database.fetch_all("SELECT username FROM users ORDER BY username")
+        row = await database.fetch_one("SELECT username FROM users WHERE username = ?", ("bob",))
+        missing = await database.fetch_one("SELECT username FROM users WHERE username = ?", ("eve",))
+
+        assert [r["username"] for r in rows] == ["ada", "bob", "cy"]
+        assert row is not None
+        assert row["username"] == "bob"
+        assert row[0] == "bob"
+        assert missing is None
+    finally:
+        await database.close()
+
+
+@pytest.mark.unit
+async def test_initialize_database_migrates_once(tmp_path: Path) -> None:
+    """Test that initialize_database runs the migrator a single time.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+    """
+    config = AppConfig(database_path=str(tmp_path / "init.db"))
+
+    with patch.object(AsyncDatabaseMigrator, "migrate", autospec=True) as migrate:
+        database = await initialize_database(config, Path("migrations"))
+    try:
+        assert migrate.call_count == 1
+    finally:
+        await database.close()
+
+
+@pytest.mark.unit
+async def test_database_connection_migrates_in_background(tmp_path: Path) -> None:
+    """Test that init returns before migrations finish and queries wait for them.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+    """
+    release = asyncio.Event()
+    original_migrate = AsyncDatabaseMigrator.migrate
+
+    async def slow_migrate(migrator: AsyncDatabaseMigrator) -> None:
+        await release.wait()
+        await original_migrate(migrator)
+
+    database = DatabaseConnection(AppConfig(database_path=str(tmp_path / "background.db")))
+    with patch.object(AsyncDatabaseMigrator, "migrate", slow_migrate):
+        await database.init()
+        query = asyncio.create_task(database.fetch_all("SELECT username FROM users"))
+        await asyncio.sleep(0)
+
+        assert not query.done()
+
+        release.set()
+        try:
+            assert await query == []
+        finally:
+            await database.close()
+
+
+@pytest.mark.unit
+async def test_database_connection_property_refuses_half_migrated_schema(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that the raw connection is withheld until migrations succeed.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+        caplog: Pytest log capture fixture.
+    """
+    release = asyncio.Event()
+
+    async def failing_migrate(_migrator: AsyncDatabaseMigrator) -> None:
+        await release.wait()
+        raise StorageError("Migration failed: boom")
+
+    database = DatabaseConnection(AppConfig(database_path=str(tmp_path / "failing.db")))
+    with patch.object(AsyncDatabaseMigrator, "migrate", failing_migrate):
+        await database.init()
+        try:
+            with pytest.raises(StorageError, match="still running"):
+                _ = database.connection
+
+            release.set()
+            with pytest.raises(StorageError, match="boom"):
+                await database.acquire()
+            await asyncio.sleep(0)  # let the task's done-callback run
+
+            assert "Background database migration failed: Migration failed: boom" in caplog.text
+            with pytest.raises(StorageError, match="boom"):
+                _ = database.connection
+        finally:
+            await database.close()
@@ -0,0 +1,150 @@
+"""Unit tests for the LangChain provider base class."""
+
+# pylint: disable=protected-access
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from langchain_core.language_models.fake_chat_models import (
+    FakeListChatModel,
+    GenericFakeChatModel,
+)
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+)
+
+from src.domain.models.message_role import MessageRole
+from src.domain.models.provider_message import ProviderMessage
+from src.infrastructure.adapters.providers.base.langchain_base import (
+    DEFAULT_BUFFER_CHARS,
+    BaseLangChainProvider,
+)
+
+
+class FakeLangChainProvider(BaseLangChainProvider):
+    """LangChain provider backed by a canned fake chat model."""
+
+    @property
+    def name(self) -> str:
+        """Provider name identifier.
+
+        Returns:
+            The provider name.
+        """
+        return "fake"
+
+    @property
+    def model(self) -> str:
+        """Model identifier.
+
+        Returns:
+            The model name.
+        """
+        return "fake-model"
+
+
+class TestBaseLangChainProvider:
+    """Test suite for BaseLangChainProvider."""
+
+    @pytest.mark.unit
+    def test_convert_messages_maps_roles(self) -> None:
+        """Test that each role becomes the matching LangChain message type."""
+        provider = FakeLangChainProvider(FakeListChatModel(responses=["unused"]))
+        messages = [
+            ProviderMessage(role=MessageRole.SYSTEM, content="rules"),
+            ProviderMessage(role=MessageRole.USER, content="Hi"),
+            ProviderMessage(role=MessageRole.ASSISTANT, content="Hello"),
+        ]
+
+        converted = provider._convert_messages(messages, system_prompt="prompt")
+
+        assert [type(m) for m in converted] == [SystemMessage, SystemMessage, HumanMessage, AIMessage]
+        assert [m.content for m in converted] == ["prompt", "rules", "Hi", "Hello"]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("buffer_chars", "expected"),
+        [
+            (1, ["Hello", " ", "big", " ", "world"]),
+            (6, ["Hello ", "big world"]),
+        ],
+    )
+    async def test_stream_response_buffers_chunks(self, buffer_chars: int, expected: list[str]) -> None:
+        """Test that chunks are joined until buffer_chars is reached.
+
+        Args:
+            buffer_chars: Minimum yielded chunk size.
+            expected: Expected yielded chunks.
+        """
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="Hello big world")]))
+        provider = FakeLangChainProvider(llm, buffer_chars=buffer_chars)
+
+        chunks = [c async for c in provider.stream_response([ProviderMessage(role=MessageRole.USER, content="Hi")])]
+
+        assert chunks == expected
+
+    @pytest.mark.unit
+    async def test_stream_response_coalesces_chunks_by_default(self) -> None:
+        """Test that the default provider joins small model chunks."""
+        content = "word " * DEFAULT_BUFFER_CHARS
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content=content)]))
+        provider = FakeLangChainProvider(llm)
+
+        chunks = [c async for c in provider.stream_response([ProviderMessage(role=MessageRole.USER, content="Hi")])]
+
+        assert "".join(chunks) == content
+        assert len(chunks) < len(content.split(" "))
+        assert all(len(c) >= DEFAULT_BUFFER_CHARS for c in chunks[:-1])
+
+    @pytest.mark.unit
+    async def test_stream_response_flushes_buffer_after_delay(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that buffered text older than buffer_delay goes out with the next chunk.
+
+        Args:
+            monkeypatch: Pytest fixture used to slow down the fake model.
+        """
+
+        async def slow_astream(*_args: Any, **_kwargs: Any) -> AsyncIterator[AIMessageChunk]:
+            for text in ("a", "b", "c"):
+                yield AIMessageChunk(content=text)
+                await asyncio.sleep(0.03)
+
+        monkeypatch.setattr(GenericFakeChatModel, "astream", slow_astream)
+        llm = GenericFakeChatModel(messages=iter([]))
+        provider = FakeLangChainProvider(llm, buffer_chars=1000, buffer_delay=0.01)
+
+        chunks = [c async for c in provider.stream_response([ProviderMessage(role=MessageRole.USER, content="Hi")])]
+
+        assert chunks == ["ab", "c"]
+
+    @pytest.mark.unit
+    async def test_complete_joins_streamed_chunks(self) -> None:
+        """Test that complete returns the full streamed response."""
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="Hello big world")]))
+        provider = FakeLangChainProvider(llm)
+
+        response = await provider.complete([ProviderMessage(role=MessageRole.USER, content="Hi")])
+
+        assert response == "Hello big world"
+
+    @pytest.mark.unit
+    async def test_stream_response_waits_for_free_request_slot(self) -> None:
+        """Test that streams beyond max_concurrency wait for a running one to finish."""
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="first reply"), AIMessage(content="second")]))
+        provider = FakeLangChainProvider(llm, buffer_chars=1, max_concurrency=1)
+        messages = [ProviderMessage(role=MessageRole.USER, content="Hi")]
+
+        first = provider.stream_response(messages)
+        assert await anext(first) == "first"
+
+        second = asyncio.ensure_future(anext(provider.stream_response(messages)))
+        await asyncio.sleep(0.01)
+        assert not second.done()
+
+        assert [c async for c in first] == [" ", "reply"]
+        assert await second == "second"
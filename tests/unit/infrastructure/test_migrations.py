@@ -12,6 +12,8 @@ from src.domain.errors.exceptions import StorageError
 from src.infrastructure.database.migrator import (
     AsyncDatabaseMigrator,
     MigrationRecord,
+    _list_migration_files,
+    _schema_fingerprint,
     run_migrations,
 )
 
@@ -217,8 +219,12 @@ async def test_run_migrations_with_config(
     async with aiosqlite.connect(str(db_path)) as conn:
         cursor = await conn.execute("SELECT name FROM sqlite_master WHERE name='test_run'")
         result = await cursor.fetchone()
+        cursor = await conn.execute("PRAGMA journal_mode")
+        journal_mode = await cursor.fetchone()
 
     assert result is not None
+    assert journal_mode is not None
+    assert journal_mode[0] == "wal"
 
 
 async def test_migrator_handles_missing_migrations_dir(
@@ -239,3 +245,109 @@ async def test_migrator_handles_missing_migrations_dir(
 
     history = await migrator.get_migration_history()
     assert len(history) == 0
+
+
+async def test_migrator_records_and_short_circuits_on_schema_version(
+    in_memory_db: aiosqlite.Connection,
+    migrations_dir: Path,
+) -> None:
+    """Test that user_version tracks the migration files and skips matching runs.
+
+    Args:
+        in_memory_db: In-memory SQLite connection.
+        migrations_dir: Temporary migrations directory.
+    """
+    (migrations_dir / "001_first.sql").write_text("CREATE TABLE first (id INTEGER);")
+    migrator = AsyncDatabaseMigrator(in_memory_db, migrations_dir)
+    await migrator.migrate()
+
+    (migrations_dir / "002_second.sql").write_text("CREATE TABLE second (id INTEGER);")
+    await migrator.migrate()
+
+    cursor = await in_memory_db.execute("PRAGMA user_version")
+    version = await cursor.fetchone()
+    assert version is not None
+    assert version[0] == _schema_fingerprint(_list_migration_files(migrations_dir))
+
+    # With the tracking rows gone, a full run would re-apply and fail.
+    await in_memory_db.execute("DELETE FROM schema_migrations")
+    await in_memory_db.commit()
+    await migrator.migrate()
+
+
+async def test_migrator_applies_file_with_duplicate_prefix_added_later(
+    in_memory_db: aiosqlite.Connection,
+    migrations_dir: Path,
+) -> None:
+    """Test that a file sharing the newest prefix is not skipped by user_version.
+
+    Args:
+        in_memory_db: In-memory SQLite connection.
+        migrations_dir: Temporary migrations directory.
+    """
+    (migrations_dir / "001_first.sql").write_text("CREATE TABLE first (id INTEGER);")
+    (migrations_dir / "002_second.sql").write_text("CREATE TABLE second (id INTEGER);")
+    migrator = AsyncDatabaseMigrator(in_memory_db, migrations_dir)
+    await migrator.migrate()
+
+    (migrations_dir / "002_backported.sql").write_text("CREATE TABLE backported (id INTEGER);")
+    await migrator.migrate()
+
+    cursor = await in_memory_db.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='backported'")
+    assert await cursor.fetchone() is not None
+
+
+def test_migration_file_listing_is_cached_until_directory_changes(migrations_dir: Path) -> None:
+    """Test that the migration listing is reused until a file is added.
+
+    Args:
+        migrations_dir: Temporary migrations directory.
+    """
+    (migrations_dir / "001_first.sql").write_text("SELECT 1;")
+
+    first = _list_migration_files(migrations_dir)
+    assert _list_migration_files(migrations_dir) is first
+
+    (migrations_dir / "002_second.sql").write_text("SELECT 2;")
+
+    assert [path.name for path in _list_migration_files(migrations_dir)] == ["001_first.sql", "002_second.sql"]
+
+
+async def test_migrator_rolls_back_all_pending_migrations_on_failure(
+    in_memory_db: aiosqlite.Connection,
+    migrations_dir: Path,
+) -> None:
+    """Test that pending migrations are applied as a single transaction.
+
+    Args:
+        in_memory_db: In-memory SQLite connection.
+        migrations_dir: Temporary migrations directory.
+    """
+    (migrations_dir / "001_valid.sql").write_text("CREATE TABLE valid (id INTEGER)")
+    (migrations_dir / "002_invalid.sql").write_text("INVALID SQL SYNTAX;")
+
+    migrator = AsyncDatabaseMigrator(in_memory_db, migrations_dir)
+    with pytest.raises(StorageError, match="001_valid, 002_invalid"):
+        await migrator.migrate()
+
+    cursor = await in_memory_db.execute("SELECT name FROM sqlite_master WHERE name='valid'")
+    assert await cursor.fetchone() is None
+    assert await migrator.get_migration_history() == []
+
+
+async def test_user_history_query_uses_user_timestamp_index(in_memory_db: aiosqlite.Connection) -> None:
+    """Test that per-user history is read in index order without a sort.
+
+    Args:
+        in_memory_db: In-memory SQLite connection.
+    """
+    await AsyncDatabaseMigrator(in_memory_db).migrate()
+
+    cursor = await in_memory_db.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM chat_messages WHERE user_id = ? ORDER BY timestamp DESC, id DESC LIMIT 10",
+        (1,),
+    )
+    plan = " ".join(row[3] for row in await cursor.fetchall())
+
+    assert "idx_messages_user_timestamp" in plan
+    assert "TEMP B-TREE" not in plan
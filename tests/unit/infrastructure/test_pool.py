@@ -0,0 +1,59 @@
+"""Tests for the SQLite connection pool."""
+
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from src.infrastructure.database.pool import SQLiteConnectionPool
+
+
+@pytest.mark.unit
+async def test_readers_see_committed_writes(tmp_path: Path) -> None:
+    """Test that reader connections observe rows committed by the writer.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+    """
+    pool = await SQLiteConnectionPool.open(str(tmp_path / "pool.db"), reader_count=2)
+    try:
+        await pool.writer.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        await pool.writer.execute("INSERT INTO items DEFAULT VALUES")
+        await pool.writer.commit()
+
+        async with pool.acquire_reader() as reader:
+            assert reader is not pool.writer
+            cursor = await reader.execute("SELECT COUNT(*) FROM items")
+            row = await cursor.fetchone()
+
+        assert row is not None
+        assert row[0] == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.unit
+async def test_readers_are_query_only(tmp_path: Path) -> None:
+    """Test that reader connections reject writes.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+    """
+    pool = await SQLiteConnectionPool.open(str(tmp_path / "pool.db"), reader_count=1)
+    try:
+        async with pool.acquire_reader() as reader:
+            with pytest.raises(aiosqlite.Error):
+                await reader.execute("CREATE TABLE forbidden (id INTEGER)")
+    finally:
+        await pool.close()
+
+
+@pytest.mark.unit
+async def test_memory_database_reads_use_writer() -> None:
+    """Test that in-memory pools share the writer for reads."""
+    pool = await SQLiteConnectionPool.open(":memory:")
+    try:
+        async with pool.acquire_reader() as reader:
+            assert reader is pool.writer
+    finally:
+        await pool.close()
@@ -0,0 +1,33 @@
+"""Tests for SQLite connection pragmas."""
+
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from src.infrastructure.database.pragmas import apply_connection_pragmas
+
+
+@pytest.mark.unit
+async def test_apply_connection_pragmas_enables_wal(tmp_path: Path) -> None:
+    """Test that WAL journaling and relaxed syncing are enabled.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+    """
+    async with aiosqlite.connect(tmp_path / "pragmas.db") as conn:
+        await apply_connection_pragmas(conn)
+
+        cursor = await conn.execute("PRAGMA journal_mode")
+        journal_mode = await cursor.fetchone()
+        cursor = await conn.execute("PRAGMA synchronous")
+        synchronous = await cursor.fetchone()
+        cursor = await conn.execute("PRAGMA busy_timeout")
+        busy_timeout = await cursor.fetchone()
+
+    assert journal_mode is not None
+    assert journal_mode[0] == "wal"
+    assert synchronous is not None
+    assert synchronous[0] == 1
+    assert busy_timeout is not None
+    assert busy_timeout[0] == 5000
@@ -11,6 +11,7 @@ from src.domain.errors.exceptions import StorageError
 from src.domain.models.chat_message import ChatMessage
 from src.domain.models.message_role import MessageRole
 from src.domain.models.user import User
+from src.infrastructure.repositories import sqlite_base_repository
 from src.infrastructure.repositories.sqlite_message_repository import (
     SQLiteMessageRepository,
 )
@@ -107,6 +108,73 @@ class TestSQLiteUserRepositoryUnit:
         assert user is not None
         assert user.username == "testuser"
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_or_create_upserts_missing_user(self, mock_database_connection: MagicMock) -> None:
+        """Test that a missing user is created by a single upsert and commit.
+
+        Args:
+            mock_database_connection: Mocked database connection.
+        """
+        repo = SQLiteUserRepository(mock_database_connection)
+
+        mock_cursor = mock_database_connection._cursor
+        mock_cursor.fetchone.side_effect = [
+            None,
+            (7, "newuser", "2024-01-01 12:00:00", "2024-01-01 12:00:00"),
+        ]
+
+        user = await repo.get_or_create("NewUser")
+
+        assert user.id == 7
+        assert user.username == "newuser"
+        upsert_sql = mock_database_connection.execute.await_args.args[0]
+        assert "ON CONFLICT (username)" in upsert_sql
+        mock_database_connection.commit.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_find_by_username_is_cached_until_delete(self, mock_database_connection: MagicMock) -> None:
+        """Test that repeated username lookups are served from the cache.
+
+        Args:
+            mock_database_connection: Mocked database connection.
+        """
+        repo = SQLiteUserRepository(mock_database_connection)
+
+        mock_cursor = mock_database_connection._cursor
+        mock_cursor.fetchone.return_value = (1, "testuser", "2024-01-01 12:00:00", "2024-01-01 12:00:00")
+        mock_cursor.rowcount = 1
+
+        first = await repo.find_by_username("TestUser")
+        second = await repo.find_by_username("testuser")
+
+        assert second is first
+        assert mock_database_connection.execute.await_count == 1
+
+        await repo.delete(1)
+        await repo.find_by_username("testuser")
+
+        assert mock_database_connection.execute.await_count == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_find_by_username_cache_can_be_disabled(self, mock_database_connection: MagicMock) -> None:
+        """Test that a zero cache size always queries the database.
+
+        Args:
+            mock_database_connection: Mocked database connection.
+        """
+        repo = SQLiteUserRepository(mock_database_connection, cache_size=0)
+
+        mock_cursor = mock_database_connection._cursor
+        mock_cursor.fetchone.return_value = (1, "testuser", "2024-01-01 12:00:00", "2024-01-01 12:00:00")
+
+        await repo.find_by_username("testuser")
+        await repo.find_by_username("testuser")
+
+        assert mock_database_connection.execute.await_count == 2
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_exists_true(self, mock_database_connection: MagicMock) -> None:
@@ -169,6 +237,58 @@ class TestSQLiteMessageRepositoryUnit:
         assert saved_message.id == 100
         mock_database_connection.execute.assert_called_once()
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_save_many_messages(self, mock_database_connection: MagicMock) -> None:
+        """Test saving several messages in one statement and one commit.
+
+        Args:
+            mock_database_connection: Mocked database connection.
+        """
+        repo = SQLiteMessageRepository(mock_database_connection)
+        messages = [
+            ChatMessage.create(user_id=1, content="Question", provider="ollama", role=MessageRole.USER),
+            ChatMessage.create(user_id=1, content="Answer", provider="ollama", role=MessageRole.ASSISTANT),
+        ]
+
+        mock_cursor = mock_database_connection._cursor
+        mock_cursor.fetchall.return_value = [(8,), (7,)]
+
+        saved_messages = await repo.save_many(messages)
+
+        assert [m.id for m in saved_messages] == [7, 8]
+        assert [m.content for m in saved_messages] == ["Question", "Answer"]
+        mock_database_connection.execute.assert_called_once()
+        mock_database_connection.commit.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_save_many_messages_chunks_large_batches(
+        self,
+        mock_database_connection: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that large batches are split into several inserts with one commit.
+
+        Args:
+            mock_database_connection: Mocked database connection.
+            monkeypatch: Pytest monkeypatch fixture.
+        """
+        monkeypatch.setattr(sqlite_base_repository, "MAX_ROWS_PER_INSERT", 2)
+        repo = SQLiteMessageRepository(mock_database_connection)
+        messages = [
+            ChatMessage.create(user_id=1, content=f"Message {i}", provider="ollama", role=MessageRole.USER) for i in range(3)
+        ]
+
+        mock_cursor = mock_database_connection._cursor
+        mock_cursor.fetchall.side_effect = [[(1,), (2,)], [(3,)]]
+
+        saved_messages = await repo.save_many(messages)
+
+        assert [m.id for m in saved_messages] == [1, 2, 3]
+        assert mock_database_connection.execute.call_count == 2
+        mock_database_connection.commit.assert_called_once()
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_find_by_id_existing(self, mock_database_connection: MagicMock) -> None:
@@ -0,0 +1,90 @@
+"""Unit tests for application bootstrap helpers."""
+
+# pylint: disable=protected-access
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from src import bootstrap
+from src.bootstrap import get_container, get_container_async, reset_container, run_sync
+from src.config.app import AppConfig
+from src.infrastructure.container import Container
+
+
+@pytest.fixture(name="memory_config")
+async def fixture_memory_config() -> AsyncGenerator[AppConfig, None]:
+    """Provide an in-memory configuration and reset the shared container.
+
+    Yields:
+        Application configuration backed by an in-memory database.
+    """
+    reset_container()
+    yield AppConfig(database_path=":memory:")
+    if bootstrap._container is not None:
+        await bootstrap._container.get_database_pool().close()
+    reset_container()
+
+
+class TestGetContainer:
+    """Test suite for the shared container accessors."""
+
+    @pytest.mark.unit
+    async def test_concurrent_first_calls_build_one_container(self, memory_config: AppConfig) -> None:
+        """Test that concurrent async callers share a single container.
+
+        Args:
+            memory_config: In-memory application configuration.
+        """
+        containers = await asyncio.gather(*(get_container_async(config=memory_config) for _ in range(5)))
+
+        assert all(container is containers[0] for container in containers)
+
+    @pytest.mark.unit
+    async def test_sync_accessor_rejects_running_loop(self, memory_config: AppConfig) -> None:
+        """Test that the sync accessor fails clearly inside an event loop.
+
+        Args:
+            memory_config: In-memory application configuration.
+        """
+        with pytest.raises(RuntimeError, match="inside an event loop"):
+            get_container(config=memory_config)
+
+    @pytest.mark.unit
+    def test_sync_accessor_keeps_connections_usable(self) -> None:
+        """Test that the sync container's database stays usable from sync code."""
+        reset_container()
+        container = get_container(config=AppConfig(database_path=":memory:"))
+        pool = container.get_database_pool()
+        try:
+            assert get_container() is container
+
+            cursor = run_sync(pool.writer.execute("SELECT 1"))
+            row = run_sync(cursor.fetchone())
+
+            assert row is not None
+            assert row[0] == 1
+        finally:
+            run_sync(pool.close())
+            reset_container()
+
+    @pytest.mark.unit
+    def test_concurrent_first_calls_on_two_event_loops(self) -> None:
+        """Test that the first-call guard is not bound to a single event loop."""
+
+        async def first_calls() -> list[Container]:
+            containers = await asyncio.gather(
+                *(get_container_async(config=AppConfig(database_path=":memory:")) for _ in range(3))
+            )
+            await containers[0].get_database_pool().close()
+            return containers
+
+        for _ in range(2):
+            reset_container()
+            try:
+                containers = asyncio.run(first_calls())
+            finally:
+                reset_container()
+
+            assert all(container is containers[0] for container in containers)